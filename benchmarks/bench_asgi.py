@@ -0,0 +1,183 @@
+"""Compare concurrent throughput of the ASGI and WSGI deployments.
+
+Usage:
+    pip install uvicorn
+    python benchmarks/bench_asgi.py --connections 50 --duration 10
+
+Both servers run as one process on the same seeded SQLite file: uvicorn
+serving blogicum.asgi (async read-only views) and Django's threaded WSGI
+server serving blogicum.wsgi. A small asyncio client keeps --connections
+keep-alive connections busy with anonymous GETs of the feed, a category
+page and the about page, with the page cache disabled.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+from bench_views import percentile
+from common import PROJECT_DIR, seed_raw, setup_django
+
+HOST = '127.0.0.1'
+SERVERS = {
+    'wsgi': [
+        sys.executable, '-c',
+        'import sys\n'
+        'from django.core.servers.basehttp import run\n'
+        'from blogicum.wsgi import application\n'
+        'run(sys.argv[1], int(sys.argv[2]), application, threading=True)',
+    ],
+    'asgi': [
+        sys.executable, '-m', 'uvicorn', 'blogicum.asgi:application',
+        '--no-access-log', '--log-level', 'warning',
+    ],
+}
+
+
+def write_settings(directory, db_path):
+    with open(os.path.join(directory, 'bench_settings.py'), 'w') as stream:
+        stream.write(textwrap.dedent(f'''\
+            from blogicum.settings import *  # noqa: F401,F403
+
+            DEBUG = False
+            ALLOWED_HOSTS = ['*']
+            PAGE_CACHE_ENABLED = False
+            DATABASES['default']['NAME'] = {str(db_path)!r}
+        '''))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'Server on port {port} did not start')
+
+
+async def fetch(reader, writer, path):
+    writer.write(
+        f'GET {path} HTTP/1.1\r\nHost: localhost\r\n'
+        'Connection: keep-alive\r\n\r\n'.encode()
+    )
+    await writer.drain()
+    status = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode().partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status.split()[1])
+
+
+async def connection_loop(port, paths, deadline, latencies, errors):
+    rnd = random.Random()
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await fetch(reader, writer, rnd.choice(paths))
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                errors.append(1)
+                writer.close()
+                reader, writer = await asyncio.open_connection(HOST, port)
+                continue
+            if status == 200:
+                latencies.append((time.perf_counter() - started) * 1000)
+            else:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def load(port, paths, connections, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        connection_loop(port, paths, deadline, latencies, errors)
+        for _ in range(connections)
+    ))
+    return latencies, errors
+
+
+def run_server(name, settings_dir, paths, args):
+    port = free_port()
+    command = SERVERS[name] + (
+        [HOST, str(port)] if name == 'wsgi'
+        else ['--host', HOST, '--port', str(port)]
+    )
+    env = {
+        **os.environ,
+        'DJANGO_SETTINGS_MODULE': 'bench_settings',
+        'PYTHONPATH': os.pathsep.join([settings_dir, str(PROJECT_DIR)]),
+    }
+    server = subprocess.Popen(
+        command, env=env, cwd=PROJECT_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port)
+        asyncio.run(load(port, paths, args.connections, 1))
+        latencies, errors = asyncio.run(
+            load(port, paths, args.connections, args.duration)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        'requests_per_s': round(len(latencies) / args.duration, 1),
+        'p50_ms': round(percentile(latencies, 0.5), 1) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95), 1) if latencies else None,
+        'errors': len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=10_000)
+    parser.add_argument('--connections', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--servers', nargs='+', choices=list(SERVERS),
+                        default=list(SERVERS))
+    args = parser.parse_args()
+
+    db_path = setup_django()
+    from django.core.management import call_command
+    from django.db import connections
+
+    try:
+        call_command('migrate', verbosity=0)
+        volumes = seed_raw(args.posts)
+        connections.close_all()
+        paths = ['/', '/?page=2', '/category/category-1/', '/pages/about/']
+        with tempfile.TemporaryDirectory() as settings_dir:
+            write_settings(settings_dir, db_path)
+            print(f'{volumes}, {args.connections} connections')
+            for name in args.servers:
+                result = run_server(name, settings_dir, paths, args)
+                print(f'{name:5} {result}')
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Compare feed query plans and timings before and after the feed indexes.
+
+Usage: python benchmarks/bench_indexes.py [--posts 1000000]
+"""
+import argparse
+import os
+import time
+
+from common import seed_raw, setup_django
+
+REPEAT = 20
+
+
+def feed_queries():
+    from blog.models import Comment
+    from blog.views import accuire_querry
+
+    # The first run happens at blog 0002, before the columns added by later
+    # migrations exist; none of them is needed to render a feed page.
+    later_columns = ('image_variants', 'updated_at')
+    feed = accuire_querry(filtered=True, need_comments=True).defer(
+        *later_columns
+    )
+    return {
+        'index': feed,
+        'category': feed.filter(category__slug='category-7'),
+        'profile': accuire_querry(need_comments=True).defer(
+            *later_columns
+        ).filter(author__username='user42'),
+        'comments': Comment.objects.filter(post_id=4242).order_by(
+            'created_at'
+        ),
+    }
+
+
+def measure(label):
+    print(f'\n== {label}')
+    for name, queryset in feed_queries().items():
+        page = queryset[:10]
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            list(page)
+        elapsed = (time.perf_counter() - started) / REPEAT * 1000
+        print(f'-- {name}: {elapsed:.2f} ms')
+        for line in page.explain().splitlines():
+            print(f'   {line}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    db_path = setup_django()
+    from django.core.management import call_command
+
+    try:
+        call_command('migrate', verbosity=0)
+        call_command('migrate', 'blog', '0002', verbosity=0)
+        started = time.perf_counter()
+        seed_raw(args.posts)
+        print(f'Seeded {args.posts} posts in '
+              f'{time.perf_counter() - started:.1f} s')
+
+        measure('without feed indexes')
+        started = time.perf_counter()
+        call_command('migrate', 'blog', verbosity=0)
+        print(f'\nBuilt indexes in {time.perf_counter() - started:.1f} s')
+        measure('with feed indexes')
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Compare full-text search latency with a naive icontains scan.
+
+Usage:
+    python benchmarks/bench_search.py --posts 1000000
+
+The dataset comes from ``manage.py seed`` so titles and texts use a real
+vocabulary. Each query is a random word from the same Faker pool; the
+naive scan is skipped with --skip-naive on large tables.
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+
+from common import setup_django
+from bench_views import percentile
+
+
+def measure(run, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        run(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'mean_ms': round(statistics.mean(latencies), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-naive', action='store_true')
+    args = parser.parse_args()
+
+    db_path = setup_django()
+    from django.core.management import call_command
+    from django.db.models import Q
+    from faker import Faker
+
+    from blog.models import Post
+    from blog.views import POSTS_PER_PAGE, accuire_querry
+
+    try:
+        call_command('migrate', verbosity=0)
+        call_command(
+            'seed', posts=args.posts, users=max(10, args.posts // 100),
+            comments_per_post=0, seed=args.seed,
+        )
+        Faker.seed(args.seed)
+        fake = Faker('ru_RU')
+        rnd = random.Random(args.seed)
+        queries = [fake.word() for _ in range(args.queries)]
+        queries += [' '.join(rnd.sample(queries, 2)) for _ in range(5)]
+
+        def fts(query):
+            page = accuire_querry(filtered=True).search(query)
+            list(page[:POSTS_PER_PAGE])
+            page.count()
+
+        def naive(query):
+            page = accuire_querry(filtered=True, need_comments=True).filter(
+                Q(title__icontains=query) | Q(text__icontains=query)
+            )
+            list(page[:POSTS_PER_PAGE])
+            page.count()
+
+        print(f'posts: {Post.objects.count()}, queries: {len(queries)}')
+        print(f'{"fts5":8} {measure(fts, queries)}')
+        if not args.skip_naive:
+            print(f'{"naive":8} {measure(naive, queries)}')
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
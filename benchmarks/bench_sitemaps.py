@@ -0,0 +1,68 @@
+"""Measure sitemap generation time and memory on a seeded dataset.
+
+Usage:
+    python benchmarks/bench_sitemaps.py --posts 1000000
+
+Runs the write_sitemaps command against a throwaway SQLite file and
+reports wall time, URLs written, the peak Python allocation under
+tracemalloc and the process peak RSS. Memory should stay flat as
+--posts grows, since rows are streamed to disk in chunks. Post detail
+pages require a login and are not listed, so --posts mostly drives the
+cost of the lastmod subqueries for categories and profiles.
+"""
+import argparse
+import os
+import resource
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from common import seed_raw, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=100_000)
+    args = parser.parse_args()
+
+    db_path = setup_django()
+    from django.core.management import call_command
+
+    from blog.sitemaps import SitemapWriter
+
+    output = tempfile.mkdtemp(prefix='blogicum-sitemaps-')
+    try:
+        call_command('migrate', verbosity=0)
+        started = time.perf_counter()
+        volumes = seed_raw(args.posts)
+        print(f'Seeded {volumes} in {time.perf_counter() - started:.1f} s')
+
+        writer = SitemapWriter(output, 'https://example.com', 50_000)
+        started = time.perf_counter()
+        sitemaps = writer.write()
+        elapsed = time.perf_counter() - started
+        # tracemalloc slows the writer down several times, so memory is
+        # measured on a separate run.
+        tracemalloc.start()
+        writer.write()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        urls = sum(count for _, _, count in sitemaps)
+        size = sum(
+            os.path.getsize(os.path.join(output, name))
+            for name in os.listdir(output)
+        )
+        print(f'{len(sitemaps)} sitemaps, {urls} URLs in {elapsed:.1f} s'
+              f' ({urls / elapsed:.0f} URLs/s), {size / 2**20:.1f} MiB')
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f'peak Python allocations {peak / 2**20:.1f} MiB,'
+              f' peak RSS {rss / 1024:.0f} MiB')
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
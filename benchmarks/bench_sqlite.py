@@ -0,0 +1,123 @@
+"""Measure read and write throughput under concurrency per database profile.
+
+Usage:
+    python benchmarks/bench_sqlite.py --readers 4 --writers 4 --duration 10
+
+Each profile from settings.DATABASE_PROFILES runs in a fresh interpreter
+against its own seeded SQLite file. Readers request feed pages, writers
+post comments, all as forked processes going through the Django test
+client, so connection setup, sessions and transactions are included.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+
+from common import seed_raw, setup_django
+
+PROFILES = ('development', 'production')
+ACCEPTED_STATUSES = {'reader': (200,), 'writer': (302, 404)}
+
+
+def worker(role, index, deadline, n_posts, results):
+    from django.contrib.auth import get_user_model
+    from django.db import OperationalError
+    from django.test import Client
+
+    rnd = random.Random(index)
+    client = Client()
+    client.force_login(get_user_model().objects.get(pk=index + 1))
+    done = errors = 0
+    while time.time() < deadline:
+        try:
+            if role == 'reader':
+                response = client.get(f'/?page={rnd.randint(1, 50)}')
+            else:
+                response = client.post(
+                    f'/posts/{rnd.randint(1, n_posts)}/comment/',
+                    {'text': 'Benchmark comment'},
+                )
+        except OperationalError:
+            errors += 1
+            continue
+        # A 404 means a page past the end of the feed, which is cheaper
+        # than a real one, so it must not count as a served read.
+        if response.status_code in ACCEPTED_STATUSES[role]:
+            done += 1
+        else:
+            errors += 1
+    results.put((role, done, errors))
+
+
+def run_profile(args):
+    db_path = setup_django(profile=args.profile)
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import connections
+
+    settings.ALLOWED_HOSTS = ['testserver']
+    settings.PAGE_CACHE_ENABLED = False
+    try:
+        call_command('migrate', verbosity=0)
+        seed_raw(args.posts, n_users=args.readers + args.writers + 10)
+        connections.close_all()
+
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        deadline = time.time() + args.duration
+        roles = ['reader'] * args.readers + ['writer'] * args.writers
+        processes = [
+            context.Process(
+                target=worker,
+                args=(role, index, deadline, args.posts, results),
+            )
+            for index, role in enumerate(roles)
+        ]
+        for process in processes:
+            process.start()
+        totals = {'reader': [0, 0], 'writer': [0, 0]}
+        for _ in processes:
+            role, done, errors = results.get()
+            totals[role][0] += done
+            totals[role][1] += errors
+        for process in processes:
+            process.join()
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(f'{db_path}{suffix}'):
+                os.remove(f'{db_path}{suffix}')
+    print(json.dumps({
+        'profile': args.profile,
+        'reads_per_s': round(totals['reader'][0] / args.duration, 1),
+        'read_errors': totals['reader'][1],
+        'writes_per_s': round(totals['writer'][0] / args.duration, 1),
+        'write_errors': totals['writer'][1],
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--profile', choices=PROFILES)
+    parser.add_argument('--posts', type=int, default=10_000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10)
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+    for profile in PROFILES:
+        subprocess.run(
+            [sys.executable, __file__, '--profile', profile,
+             *sys.argv[1:]],
+            check=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""Time the blog views through the test client on a seeded dataset.
+
+Usage:
+    python benchmarks/bench_views.py --posts 100000 --output after.json
+    python benchmarks/bench_views.py --posts 100000 --compare after.json
+
+Each scenario reports p50/p95 latency, SQL queries per request and the
+peak Python memory allocated while serving one request. The *_revalidate
+scenarios repeat a request with the ETag of the previous response, as a
+returning browser does. Results are written as JSON so runs from
+different commits can be diffed with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from common import PROJECT_DIR, seed_raw, setup_django
+
+WARMUP = 3
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_scenarios(rnd, volumes):
+    from blog.models import Category, Post
+
+    published = list(
+        Post.objects.published().values_list('pk', flat=True)[:1000]
+    )
+    slugs = list(
+        Category.objects.filter(is_published=True).values_list(
+            'slug', flat=True
+        )
+    )
+    deep_page = max(1, volumes['posts'] // 20)
+
+    return {
+        'index': lambda: ('get', '/'),
+        'index_deep_page': lambda: ('get', f'/?page={deep_page}'),
+        'category': lambda: ('get', f'/category/{rnd.choice(slugs)}/'),
+        'profile': lambda: (
+            'get', f'/profile/user{rnd.randint(1, volumes["users"])}/'
+        ),
+        'post_detail': lambda: ('get', f'/posts/{rnd.choice(published)}/'),
+        'index_revalidate': lambda: ('revalidate', '/'),
+        'category_revalidate': lambda: (
+            'revalidate', f'/category/{slugs[0]}/'
+        ),
+        'post_revalidate': lambda: ('revalidate', f'/posts/{published[0]}/'),
+        'comment_create': lambda: (
+            'post', f'/posts/{rnd.choice(published)}/comment/',
+        ),
+    }
+
+
+def run_scenario(client, next_request, iterations):
+    from perf.middleware import QueryTimer
+    from django.db import connection
+
+    etags = {}
+
+    def call():
+        method, url = next_request()
+        if method == 'post':
+            response = client.post(url, {'text': 'Benchmark comment'})
+        elif method == 'revalidate':
+            response = client.get(url, HTTP_IF_NONE_MATCH=etags.get(url, ''))
+            etags[url] = response.get('ETag', etags.get(url))
+        else:
+            response = client.get(url)
+        assert response.status_code in (200, 302, 304), (url, response)
+
+    for _ in range(WARMUP):
+        call()
+
+    latencies, queries = [], []
+    for _ in range(iterations):
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            started = time.perf_counter()
+            call()
+            latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(timer.count)
+
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'mean_ms': round(statistics.mean(latencies), 3),
+        'queries': max(queries),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding='utf-8') as stream:
+        baseline = json.load(stream)
+    print(f'\nvs {baseline_path} ({baseline["meta"].get("revision")})')
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if not before:
+            continue
+        change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms']
+        print(f'{name:16} p95 {before["p95_ms"]:>9} -> {result["p95_ms"]:>9}'
+              f' ms ({change:+.0%}), queries {before["queries"]}'
+              f' -> {result["queries"]}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=10_000)
+    parser.add_argument('--comments-per-post', type=int, default=2)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write results to this JSON file.')
+    parser.add_argument('--compare', help='Baseline JSON to compare with.')
+    args = parser.parse_args()
+
+    db_path = setup_django()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.test import Client
+
+    settings.ALLOWED_HOSTS = ['testserver']
+    settings.PAGE_CACHE_ENABLED = False
+    try:
+        call_command('migrate', verbosity=0)
+        started = time.perf_counter()
+        volumes = seed_raw(args.posts, args.comments_per_post, seed=args.seed)
+        print(f'Seeded {volumes} in {time.perf_counter() - started:.1f} s')
+
+        client = Client()
+        client.force_login(get_user_model().objects.get(pk=1))
+        rnd = random.Random(args.seed)
+        results = {}
+        for name, next_request in build_scenarios(rnd, volumes).items():
+            results[name] = run_scenario(client, next_request, args.requests)
+            print(f'{name:16} {results[name]}')
+    finally:
+        os.remove(db_path)
+
+    current = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'requests': args.requests,
+            **volumes,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump(current, stream, indent=2)
+    if args.compare:
+        compare(current, args.compare)
+
+
+if __name__ == '__main__':
+    main()
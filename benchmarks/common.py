@@ -0,0 +1,128 @@
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent / 'blogicum'
+BATCH_SIZE = 50_000
+
+
+def setup_django(db_path=None, profile=None):
+    """Configure Django against a throwaway SQLite file and return its path.
+
+    ``profile`` picks an entry of ``settings.DATABASE_PROFILES``.
+    """
+    sys.path.insert(0, str(PROJECT_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+    from django.conf import settings
+
+    if db_path is None:
+        handle, db_path = tempfile.mkstemp(prefix='blogicum-bench-',
+                                           suffix='.sqlite3')
+        os.close(handle)
+    database = settings.DATABASES['default']
+    if profile is not None:
+        for key in ('CONN_MAX_AGE', 'OPTIONS'):
+            database.pop(key, None)
+        database.update(settings.DATABASE_PROFILES[profile])
+    database['NAME'] = str(db_path)
+
+    import django
+
+    django.setup()
+    return db_path
+
+
+def as_db_datetime(value):
+    return str(value.astimezone(timezone.utc).replace(tzinfo=None))
+
+
+def seed_raw(n_posts, comments_per_post=1, n_users=None, n_categories=None,
+             seed=0):
+    """Insert a synthetic dataset with plain executemany batches.
+
+    Users and categories scale with the post count unless given. Ratios:
+    ~10% hidden categories, ~10% unpublished posts and ~5% scheduled
+    posts, so the published-feed filters are selective.
+    """
+    from django.db import connection, transaction
+
+    n_users = n_users or max(10, n_posts // 100)
+    n_categories = n_categories or max(10, n_posts // 10_000)
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    created_at = as_db_datetime(now)
+    with transaction.atomic(), connection.cursor() as cursor:
+        post_columns = {
+            column.name for column in
+            connection.introspection.get_table_description(
+                cursor, 'blog_post'
+            )
+        }
+        extra_columns = extra_values = ''
+        if 'image_variants' in post_columns:
+            extra_columns += ', image_variants'
+            extra_values += ", '{}'"
+        if 'updated_at' in post_columns:
+            extra_columns += ', updated_at'
+            extra_values += f", '{created_at}'"
+        cursor.executemany(
+            'INSERT INTO auth_user (id, password, is_superuser, username,'
+            ' first_name, last_name, email, is_staff, is_active,'
+            ' date_joined) VALUES (%s, %s, 0, %s, %s, %s, %s, 0, 1, %s)',
+            [(i, '!', f'user{i}', '', '', '', created_at)
+             for i in range(1, n_users + 1)]
+        )
+        cursor.executemany(
+            'INSERT INTO blog_category (id, is_published, created_at, title,'
+            ' description, slug) VALUES (%s, %s, %s, %s, %s, %s)',
+            [(i, i % 10 != 0, created_at, f'Category {i}', '',
+              f'category-{i}') for i in range(1, n_categories + 1)]
+        )
+        cursor.executemany(
+            'INSERT INTO blog_location (id, is_published, created_at, name)'
+            ' VALUES (%s, 1, %s, %s)',
+            [(i, created_at, f'Location {i}') for i in range(1, 101)]
+        )
+        post_sql = (
+            'INSERT INTO blog_post (id, is_published, created_at, title,'
+            ' text, pub_date, author_id, location_id, image, category_id,'
+            f' comment_count{extra_columns})'
+            ' VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s'
+            f'{extra_values})'
+        )
+        comment_sql = (
+            'INSERT INTO blog_comment (text, post_id, created_at, author_id)'
+            ' VALUES (%s, %s, %s, %s)'
+        )
+        for start in range(1, n_posts + 1, BATCH_SIZE):
+            posts, comments = [], []
+            for pk in range(start, min(start + BATCH_SIZE, n_posts + 1)):
+                roll = rnd.random()
+                if roll < 0.05:
+                    pub_date = now + timedelta(minutes=rnd.randint(1, 10**5))
+                else:
+                    pub_date = now - timedelta(minutes=rnd.randint(1, 10**7))
+                posts.append((
+                    pk, not 0.05 <= roll < 0.15, created_at, f'Post {pk}',
+                    'Lorem ipsum dolor sit amet ' * 8,
+                    as_db_datetime(pub_date),
+                    rnd.randint(1, n_users), rnd.randint(1, 100), '',
+                    rnd.randint(1, n_categories), comments_per_post,
+                ))
+                comments.extend(
+                    ('Comment', pk, as_db_datetime(pub_date),
+                     rnd.randint(1, n_users))
+                    for _ in range(comments_per_post)
+                )
+            cursor.executemany(post_sql, posts)
+            cursor.executemany(comment_sql, comments)
+        cursor.execute('ANALYZE')
+    return {
+        'posts': n_posts,
+        'comments': n_posts * comments_per_post,
+        'users': n_users,
+        'categories': n_categories,
+    }
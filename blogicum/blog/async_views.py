@@ -0,0 +1,42 @@
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from perf.middleware import add_template_time, track_queries
+
+
+def as_async_view(view_class, **initkwargs):
+    view = view_class.as_view(**initkwargs)
+
+    def respond(request, *args, **kwargs):
+        try:
+            with track_queries(request):
+                response = view(request, *args, **kwargs)
+                if callable(getattr(response, 'render', None)):
+                    started = time.perf_counter()
+                    response.render()
+                    add_template_time(
+                        request, time.perf_counter() - started
+                    )
+            return response
+        finally:
+            close_old_connections()
+
+    # В Django 3.2 нет асинхронного ORM, поэтому запросы и отрисовка идут
+    # в пуле потоков, а не в единственном потоке для синхронных view.
+    async def async_view(request, *args, **kwargs):
+        return await sync_to_async(respond, thread_sensitive=False)(
+            request, *args, **kwargs
+        )
+
+    async_view.view_class = view_class
+    async_view.view_initkwargs = initkwargs
+    return async_view
+
+
+def read_only_view(view_class, **initkwargs):
+    if settings.ASYNC_READ_VIEWS:
+        return as_async_view(view_class, **initkwargs)
+    return view_class.as_view(**initkwargs)
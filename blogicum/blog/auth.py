@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+from django.db import router
+
+User = get_user_model()
+
+USER_KEY = 'user_snapshot:{}'
+# Поля, которые нужны страницам и проверке доступа. Пароль, флаг
+# суперпользователя и даты в кэш не попадают и при обращении к ним
+# дочитываются из базы как отложенные поля.
+SNAPSHOT_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'email', 'is_active',
+    'is_staff',
+)
+
+
+def user_cache():
+    return caches[settings.SESSION_CACHE_ALIAS]
+
+
+def user_cache_key(user_id):
+    return USER_KEY.format(user_id)
+
+
+def cache_user(user):
+    values = {
+        field.attname: getattr(user, field.attname)
+        for field in User._meta.concrete_fields
+        if field.attname in SNAPSHOT_FIELDS
+    }
+    user_cache().set(
+        user_cache_key(user.pk),
+        (values, user.get_session_auth_hash()),
+        settings.USER_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user(user_id):
+    user_cache().delete(user_cache_key(user_id))
+
+
+def restore_user(snapshot):
+    values, session_hash = snapshot
+    user = User.from_db(
+        router.db_for_read(User), list(values), list(values.values())
+    )
+
+    # Вместо хеша пароля хранится хеш для проверки сессии; после смены
+    # пароля на этом объекте хеш считается заново.
+    def get_session_auth_hash():
+        if 'password' in user.__dict__:
+            return User.get_session_auth_hash(user)
+        return session_hash
+
+    user.get_session_auth_hash = get_session_auth_hash
+    return user
+
+
+class CachedModelBackend(ModelBackend):
+
+    def get_user(self, user_id):
+        snapshot = user_cache().get(user_cache_key(user_id))
+        if snapshot is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache_user(user)
+            return user
+        user = restore_user(snapshot)
+        return user if self.user_can_authenticate(user) else None
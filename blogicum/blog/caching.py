@@ -0,0 +1,119 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Min
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+PAGE_VERSION_KEY = 'page_cache:version'
+POST_COUNT_VERSION_KEY = 'post_count:version'
+FEED_VERSION_KEY = 'feed:version'
+
+
+def get_version(key):
+    # Метки версий хранятся в общем кэше: их сдвигают и веб-процессы, и
+    # runworker, и команды управления. Сами закэшированные данные могут
+    # лежать в кэше процесса, ведь метка входит в их ключ.
+    cache = caches[settings.SHARED_CACHE_ALIAS]
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    cache = caches[settings.SHARED_CACHE_ALIAS]
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_pages_version():
+    bump_version(PAGE_VERSION_KEY)
+
+
+def bump_post_counts_version():
+    bump_version(POST_COUNT_VERSION_KEY)
+
+
+def bump_feeds_version():
+    bump_version(FEED_VERSION_KEY)
+
+
+def seconds_to_next_publication(**filters):
+    from .models import Post
+
+    now = timezone.now()
+    next_pub_date = Post.objects.filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__gt=now,
+        **filters
+    ).aggregate(next_pub_date=Min('pub_date'))['next_pub_date']
+    if next_pub_date is not None:
+        return (next_pub_date - now).total_seconds()
+
+
+def conditional_response(request, response):
+    return get_conditional_response(
+        request,
+        etag=response.get('ETag'),
+        last_modified=parse_http_date_safe(response.get('Last-Modified')),
+        response=response,
+    )
+
+
+class AnonymousPageCacheMixin:
+    publication_aware = True
+
+    def page_cache_applies(self, request):
+        return (
+            settings.PAGE_CACHE_ENABLED
+            and request.method == 'GET'
+            and not request.user.is_authenticated
+        )
+
+    def get_page_cache_key(self, request):
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        version = get_version(PAGE_VERSION_KEY)
+        return f'page:{version}:{path}'
+
+    def get_page_cache_timeout(self):
+        timeout = settings.PAGE_CACHE_TIMEOUT
+        if self.publication_aware:
+            next_publication = seconds_to_next_publication()
+            if next_publication is not None:
+                timeout = min(timeout, int(next_publication))
+        return timeout
+
+    def store_page(self, request, key, response):
+        if (
+            response.status_code != 200
+            or response.cookies
+            or request.META.get('CSRF_COOKIE_USED')
+        ):
+            return
+        timeout = self.get_page_cache_timeout()
+        if timeout > 0:
+            caches[settings.PAGE_CACHE_ALIAS].set(key, response, timeout)
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.page_cache_applies(request):
+            return super().dispatch(request, *args, **kwargs)
+        key = self.get_page_cache_key(request)
+        response = caches[settings.PAGE_CACHE_ALIAS].get(key)
+        if response is not None:
+            return conditional_response(request, response)
+        response = super().dispatch(request, *args, **kwargs)
+        if getattr(response, 'is_rendered', True):
+            self.store_page(request, key, response)
+        else:
+            response.add_post_render_callback(
+                lambda rendered: self.store_page(request, key, rendered)
+            )
+        return response
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from .caching import bump_version, get_version
+
+CARD_TEMPLATE = 'includes/post_card.html'
+VERSION_KEY = 'post_card:version'
+
+
+def get_cards_version():
+    return get_version(VERSION_KEY)
+
+
+def bump_cards_version():
+    bump_version(VERSION_KEY)
+
+
+def card_key(post, version):
+    # Дата изменения публикации входит в ключ, поэтому правка публикации,
+    # её комментариев или фото в любом процессе даёт новый ключ и не
+    # требует удалять старую карточку из кэша каждого процесса.
+    return f'post_card:{version}:{post.pk}:{post.updated_at.timestamp()}'
+
+
+def render_post_cards(posts):
+    version = get_cards_version()
+    keys = {post.pk: card_key(post, version) for post in posts}
+    cached = cache.get_many(keys.values())
+    cards, missing = [], {}
+    for post in posts:
+        html = cached.get(keys[post.pk])
+        if html is None:
+            html = render_to_string(CARD_TEMPLATE, {'post': post})
+            missing[keys[post.pk]] = html
+        cards.append(mark_safe(html))
+    if missing:
+        cache.set_many(missing, settings.POST_CARD_CACHE_TIMEOUT)
+    return cards
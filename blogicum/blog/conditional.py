@@ -0,0 +1,94 @@
+import hashlib
+
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .caching import POST_COUNT_VERSION_KEY, get_version
+from .cards import get_cards_version
+from .models import Post
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+class ConditionalGetMixin:
+    send_last_modified = True
+
+    def get_validators(self):
+        raise NotImplementedError
+
+    def get_etag(self, last_modified, parts):
+        request = self.request
+        raw = ':'.join(str(part) for part in (
+            last_modified and last_modified.timestamp(),
+            *parts,
+            # Автор, категория и местоположение выводятся на странице,
+            # но при их изменении публикации не сохраняются.
+            get_cards_version(),
+            # Страница авторизованного пользователя содержит его данные и
+            # CSRF-токен, который меняется при входе вместе с сессией.
+            request.user.pk,
+            request.user.is_authenticated and request.session.session_key,
+        ))
+        return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+    def set_validators(self, response, etag, last_modified):
+        if response.status_code not in (200, 304):
+            return response
+        response.headers.setdefault('ETag', etag)
+        if last_modified is not None:
+            response.headers.setdefault(
+                'Last-Modified', http_date(last_modified.timestamp())
+            )
+        patch_cache_control(
+            response,
+            no_cache=True,
+            private=self.request.user.is_authenticated,
+        )
+        return response
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        last_modified, parts = self.get_validators()
+        etag = self.get_etag(last_modified, parts)
+        if not self.send_last_modified:
+            last_modified = None
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=(
+                last_modified and int(last_modified.timestamp())
+            ),
+        )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+
+class PostFeedConditionalGetMixin(ConditionalGetMixin):
+    # Удаление публикации или правка категории, местоположения и автора не
+    # сдвигают ни одну дату ленты, их учитывает только ETag. Поэтому лента
+    # не отдаёт Last-Modified, иначе If-Modified-Since вернул бы 304 для
+    # изменившейся страницы.
+    send_last_modified = False
+
+    def get_validators(self):
+        # Наибольшая дата изменения по всей таблице берётся из индекса без
+        # просмотра ленты; при этом любая правка сбрасывает ETag всех лент,
+        # как и кэш страниц.
+        updated_at = Post.objects.aggregate(
+            updated_at=Max('updated_at')
+        )['updated_at']
+        # Отложенная публикация появляется в ленте без сохранения, поэтому
+        # лента считается изменённой и в момент её выхода.
+        pub_date = self.get_queryset().filter(
+            pub_date__lte=timezone.now()
+        ).order_by('-pub_date').values_list('pub_date', flat=True).first()
+        dates = [date for date in (updated_at, pub_date) if date is not None]
+        # Удаление публикации не сдвигает даты изменения оставшихся, его
+        # отражает версия счётчиков публикаций.
+        return max(dates, default=None), (
+            get_version(POST_COUNT_VERSION_KEY),
+        )
@@ -0,0 +1,141 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.syndication.views import Feed
+from django.core.cache import caches
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import patch_cache_control, set_response_etag
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.text import Truncator
+
+from .caching import (
+    FEED_VERSION_KEY, conditional_response, get_version,
+    seconds_to_next_publication
+)
+from .models import Category
+from .views import accuire_querry
+
+User = get_user_model()
+
+FEED_ITEMS = 20
+FEED_DESCRIPTION_WORDS = 60
+
+
+class PostsFeed(Feed):
+    title = 'Блогикум'
+    description = 'Новые публикации Блогикума.'
+
+    def link(self, obj):
+        return reverse('blog:index')
+
+    def scope(self, obj):
+        return {}
+
+    def items(self, obj):
+        return accuire_querry(filtered=True, need_comments=True).filter(
+            **self.scope(obj)
+        )[:FEED_ITEMS]
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return Truncator(item.text).words(FEED_DESCRIPTION_WORDS)
+
+    def item_link(self, item):
+        return reverse('blog:post_detail', kwargs={'post_id': item.pk})
+
+    def item_pubdate(self, item):
+        return item.pub_date
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_author_name(self, item):
+        if item.author is not None:
+            return item.author.get_full_name() or item.author.username
+
+    def item_categories(self, item):
+        return (item.category.title,)
+
+    def get_cache_key(self, request):
+        url = hashlib.md5(
+            request.build_absolute_uri(request.path).encode()
+        ).hexdigest()
+        version = get_version(FEED_VERSION_KEY)
+        return f'feed:{version}:{url}'
+
+    def get_cache_timeout(self, obj):
+        timeout = settings.FEED_CACHE_TIMEOUT
+        next_publication = seconds_to_next_publication(**self.scope(obj))
+        if next_publication is not None:
+            timeout = min(timeout, int(next_publication))
+        return timeout
+
+    def __call__(self, request, *args, **kwargs):
+        cache = caches[settings.PAGE_CACHE_ALIAS]
+        key = self.get_cache_key(request)
+        response = cache.get(key)
+        if response is None:
+            response = super().__call__(request, *args, **kwargs)
+            set_response_etag(response)
+            patch_cache_control(response, no_cache=True)
+            timeout = self.get_cache_timeout(
+                self.get_object(request, *args, **kwargs)
+            )
+            if timeout > 0:
+                cache.set(key, response, timeout)
+        return conditional_response(request, response)
+
+
+class CategoryPostsFeed(PostsFeed):
+
+    def get_object(self, request, slug):
+        return get_object_or_404(Category, slug=slug, is_published=True)
+
+    def scope(self, obj):
+        return {'category': obj}
+
+    def title(self, obj):
+        return f'Блогикум: {obj.title}'
+
+    def description(self, obj):
+        return obj.description
+
+    def link(self, obj):
+        return obj.get_absolute_url()
+
+
+class AuthorPostsFeed(PostsFeed):
+
+    def get_object(self, request, username):
+        return get_object_or_404(User, username=username)
+
+    def scope(self, obj):
+        return {'author': obj}
+
+    def title(self, obj):
+        return f'Блогикум: публикации {obj.username}'
+
+    def description(self, obj):
+        return f'Новые публикации пользователя {obj.username}.'
+
+    def link(self, obj):
+        return reverse('blog:profile', kwargs={'username': obj.username})
+
+
+class AtomPostsFeed(PostsFeed):
+    feed_type = Atom1Feed
+    subtitle = PostsFeed.description
+
+
+class AtomCategoryPostsFeed(CategoryPostsFeed):
+    feed_type = Atom1Feed
+    subtitle = CategoryPostsFeed.description
+
+
+class AtomAuthorPostsFeed(AuthorPostsFeed):
+    feed_type = Atom1Feed
+    subtitle = AuthorPostsFeed.description
@@ -1,4 +1,8 @@
 from django import forms
+from django.contrib.auth.forms import PasswordResetForm
+from django.template.loader import render_to_string
+
+from tasks.mail import send_email
 
 from .models import Post, Comment
 
@@ -22,3 +26,18 @@ class PostForm(forms.ModelForm):
             'pub_date': forms.DateTimeInput(attrs={'type': 'datetime-local'}),
             'text': forms.Textarea(attrs={'rows': 3}),
         }
+
+
+class QueuedPasswordResetForm(PasswordResetForm):
+
+    def send_mail(self, subject_template_name, email_template_name,
+                  context, from_email, to_email,
+                  html_email_template_name=None):
+        subject = ''.join(
+            render_to_string(subject_template_name, context).splitlines()
+        )
+        body = render_to_string(email_template_name, context)
+        html_body = None
+        if html_email_template_name is not None:
+            html_body = render_to_string(html_email_template_name, context)
+        send_email.delay(subject, body, from_email, [to_email], html_body)
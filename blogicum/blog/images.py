@@ -0,0 +1,86 @@
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+THUMBS_DIR = 'thumbs'
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+
+def variant_name(name, width, extension):
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(
+        directory, THUMBS_DIR, f'{stem}_{width}w.{extension}'
+    )
+
+
+def encode(image, image_format):
+    buffer = BytesIO()
+    if image_format == 'WEBP':
+        image.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+    elif image_format == 'JPEG':
+        image.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True,
+                   progressive=True)
+    else:
+        image.save(buffer, 'PNG', optimize=True)
+    return ContentFile(buffer.getvalue())
+
+
+def delete_variants(storage, variants):
+    if variants.get('webp'):
+        storage.delete(variants['webp'])
+    for size in variants.get('sizes', []):
+        storage.delete(size['fallback'])
+        storage.delete(size['webp'])
+
+
+def build_variants(field_file):
+    storage = field_file.storage
+    with field_file.open('rb') as source:
+        original = Image.open(source)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+    has_alpha = original.mode in ('RGBA', 'LA') or (
+        original.mode == 'P' and 'transparency' in original.info
+    )
+    original = original.convert('RGBA' if has_alpha else 'RGB')
+    fallback_format, fallback_ext = (
+        ('PNG', 'png') if has_alpha else ('JPEG', 'jpg')
+    )
+
+    sizes = []
+    for width in sorted(settings.POST_IMAGE_WIDTHS):
+        if width >= original.width:
+            break
+        height = round(original.height * width / original.width)
+        resized = original.resize((width, height), Image.Resampling.LANCZOS)
+        sizes.append({
+            'width': width,
+            'fallback': storage.save(
+                variant_name(field_file.name, width, fallback_ext),
+                encode(resized, fallback_format)
+            ),
+            'webp': storage.save(
+                variant_name(field_file.name, width, 'webp'),
+                encode(resized, 'WEBP')
+            ),
+        })
+    webp_original = storage.save(
+        variant_name(field_file.name, original.width, 'webp'),
+        encode(original, 'WEBP')
+    )
+    return {
+        'width': original.width,
+        'webp': webp_original,
+        'sizes': sizes,
+    }
+
+
+def generate_post_thumbnails(post):
+    delete_variants(post.image.storage, post.image_variants)
+    post.image_variants = build_variants(post.image) if post.image else {}
+    post.save(update_fields=['image_variants', 'updated_at'])
@@ -0,0 +1,273 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from PIL import Image
+
+from blog.caching import (
+    bump_feeds_version, bump_pages_version, bump_post_counts_version
+)
+from blog.cards import bump_cards_version
+from blog.images import build_variants
+from blog.models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+REQUIRED_FIELDS = ('title', 'text', 'pub_date', 'author', 'category')
+
+
+def ingest_image(source, name):
+    try:
+        with Image.open(source) as image:
+            image.verify()
+        post = Post()
+        with open(source, 'rb') as stream:
+            post.image.save(name, File(stream), save=False)
+        return post.image.name, build_variants(post.image), None
+    except (OSError, SyntaxError, ValueError,
+            Image.DecompressionBombError) as error:
+        return '', {}, f'{source}: {error}'
+
+
+def parse_date(value):
+    if not value:
+        return None
+    date = parse_datetime(value)
+    if date is None:
+        raise ValueError(f'Неверная дата: {value}')
+    if timezone.is_naive(date):
+        date = timezone.make_aware(date)
+    return date
+
+
+class Command(BaseCommand):
+    help = 'Импортирует публикации с комментариями из файла JSONL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path', help='Файл JSONL, одна публикация в строке.'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count(),
+            help='Размер пула процессов для обработки фото.',
+        )
+        parser.add_argument(
+            '--images-dir',
+            help='Каталог, относительно которого указаны пути к фото.',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='Файл контрольной точки, по умолчанию <path>.checkpoint.',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Начать импорт заново, не учитывая контрольную точку.',
+        )
+
+    def handle(self, path, **options):
+        if not os.path.exists(path):
+            raise CommandError(f'Файл не найден: {path}')
+        self.images_dir = options['images_dir'] or os.path.dirname(path)
+        self.checkpoint = options['checkpoint'] or f'{path}.checkpoint'
+        self.posts = self.comments = self.skipped = self.failed_images = 0
+        offset, line_number = 0, 0
+        if not options['restart']:
+            offset, line_number = self.resume()
+
+        pool = None
+        if options['processes']:
+            connections.close_all()
+            pool = ProcessPoolExecutor(max_workers=options['processes'])
+        started = time.perf_counter()
+        try:
+            with open(path, 'rb') as stream:
+                stream.seek(offset)
+                batch, start = [], (offset, line_number)
+                for line in iter(stream.readline, b''):
+                    line_number += 1
+                    offset += len(line)
+                    record = self.parse(line, line_number)
+                    if record is not None:
+                        batch.append(record)
+                    if len(batch) >= options['batch_size']:
+                        self.import_batch(
+                            batch, start, (offset, line_number), pool
+                        )
+                        batch, start = [], (offset, line_number)
+                if batch:
+                    self.import_batch(
+                        batch, start, (offset, line_number), pool
+                    )
+        finally:
+            if pool:
+                pool.shutdown()
+
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        bump_cards_version()
+        bump_pages_version()
+        bump_feeds_version()
+        bump_post_counts_version()
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f'Публикаций: {self.posts} ({self.posts / elapsed:.0f} в секунду),'
+            f' комментариев: {self.comments}, пропущено строк:'
+            f' {self.skipped}, фото с ошибками: {self.failed_images}'
+        ))
+
+    def resume(self):
+        if not os.path.exists(self.checkpoint):
+            return 0, 0
+        with open(self.checkpoint, encoding='utf-8') as stream:
+            state = json.load(stream)
+        if Post.objects.filter(pk=state['last_pk']).exists():
+            return state['offset'], state['line']
+        return state['batch_offset'], state['batch_line']
+
+    def save_checkpoint(self, **state):
+        temporary = f'{self.checkpoint}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as stream:
+            json.dump(state, stream)
+        os.replace(temporary, self.checkpoint)
+
+    def parse(self, line, line_number):
+        if not line.strip():
+            return None
+        try:
+            record = json.loads(line)
+            missing = [key for key in REQUIRED_FIELDS if not record.get(key)]
+            if missing:
+                raise ValueError(f'нет полей {", ".join(missing)}')
+            record['pub_date'] = parse_date(record['pub_date'])
+            record['created_at'] = parse_date(record.get('created_at'))
+            for comment in record.setdefault('comments', []):
+                if not comment.get('author') or not comment.get('text'):
+                    raise ValueError('у комментария нет автора или текста')
+                comment['created_at'] = parse_date(comment.get('created_at'))
+        except (ValueError, TypeError, AttributeError) as error:
+            self.skipped += 1
+            self.stderr.write(f'Строка {line_number}: {error}')
+            return None
+        return record
+
+    def get_or_create_ids(self, model, field, values, defaults):
+        existing = dict(
+            model.objects.filter(**{f'{field}__in': values}).values_list(
+                field, 'pk'
+            )
+        )
+        missing = [value for value in values if value not in existing]
+        if missing:
+            model.objects.bulk_create(
+                [model(**{field: value}, **defaults(value))
+                 for value in missing],
+                ignore_conflicts=True,
+            )
+            existing.update(
+                model.objects.filter(**{f'{field}__in': missing})
+                .values_list(field, 'pk')
+            )
+        return existing
+
+    def ingest_images(self, batch, pool):
+        jobs = [
+            (os.path.join(self.images_dir, record['image']),
+             os.path.basename(record['image']))
+            for record in batch if record.get('image')
+        ]
+        if pool:
+            results = pool.map(ingest_image, *zip(*jobs)) if jobs else []
+        else:
+            results = [ingest_image(*job) for job in jobs]
+        results = iter(results)
+        for record in batch:
+            if not record.get('image'):
+                continue
+            record['image'], record['image_variants'], error = next(results)
+            if error:
+                self.failed_images += 1
+                self.stderr.write(error)
+
+    def import_batch(self, batch, start, end, pool):
+        self.ingest_images(batch, pool)
+        usernames = {record['author'] for record in batch} | {
+            comment['author']
+            for record in batch for comment in record['comments']
+        }
+        unusable_password = make_password(None)
+        authors = self.get_or_create_ids(
+            User, 'username', usernames,
+            lambda username: {'password': unusable_password},
+        )
+        categories = self.get_or_create_ids(
+            Category, 'slug', {record['category'] for record in batch},
+            lambda slug: {'title': slug},
+        )
+        locations = self.get_or_create_ids(
+            Location, 'name',
+            {record['location'] for record in batch
+             if record.get('location')},
+            lambda name: {},
+        )
+
+        post_pk = (Post.objects.aggregate(top=Max('pk'))['top'] or 0) + 1
+        comment_pk = (Comment.objects.aggregate(top=Max('pk'))['top'] or 0)
+        posts, comments = [], []
+        for record in batch:
+            post = Post(
+                pk=post_pk,
+                title=record['title'],
+                text=record['text'],
+                pub_date=record['pub_date'],
+                is_published=record.get('is_published', True),
+                author_id=authors[record['author']],
+                category_id=categories[record['category']],
+                location_id=locations.get(record.get('location')),
+                image=record.get('image', ''),
+                image_variants=record.get('image_variants', {}),
+                comment_count=len(record['comments']),
+            )
+            posts.append((post, record['created_at']))
+            for comment in record['comments']:
+                comment_pk += 1
+                comments.append((Comment(
+                    pk=comment_pk,
+                    post_id=post_pk,
+                    author_id=authors[comment['author']],
+                    text=comment['text'],
+                ), comment['created_at']))
+            post_pk += 1
+
+        with transaction.atomic():
+            self.insert(Post, posts)
+            self.insert(Comment, comments)
+            self.save_checkpoint(
+                batch_offset=start[0], batch_line=start[1],
+                offset=end[0], line=end[1], last_pk=post_pk - 1,
+            )
+        self.posts += len(posts)
+        self.comments += len(comments)
+
+    def insert(self, model, objects_with_dates):
+        objects = [obj for obj, _ in objects_with_dates]
+        model.objects.bulk_create(objects)
+        dated = []
+        for obj, created_at in objects_with_dates:
+            if created_at is not None:
+                obj.created_at = created_at
+                dated.append(obj)
+        if dated:
+            model.objects.bulk_update(dated, ['created_at'])
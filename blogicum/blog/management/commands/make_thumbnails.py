@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from blog.images import generate_post_thumbnails
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Создаёт уменьшенные копии и WebP-версии фото публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Пересоздать копии и для публикаций, где они уже есть.',
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').order_by('pk')
+        if not options['force']:
+            posts = posts.filter(image_variants={})
+        done = failed = 0
+        for post in posts.iterator():
+            try:
+                generate_post_thumbnails(post)
+            except (OSError, ValueError) as error:
+                failed += 1
+                self.stderr.write(f'{post.image.name}: {error}')
+            else:
+                done += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Обработано фото: {done}, с ошибками: {failed}'
+        ))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.search import rebuild_index, search_available
+
+
+class Command(BaseCommand):
+    help = 'Перестраивает полнотекстовый индекс публикаций.'
+
+    def handle(self, *args, **options):
+        if not search_available():
+            raise CommandError(
+                'Полнотекстовый индекс доступен только на SQLite с FTS5.'
+            )
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS('Индекс поиска перестроен.'))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.caching import bump_pages_version
+from blog.cards import bump_cards_version
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает счётчики комментариев у публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать число расходящихся счётчиков.',
+        )
+
+    def handle(self, *args, **options):
+        actual = Coalesce(
+            Subquery(
+                Comment.objects.filter(
+                    post=OuterRef('pk')
+                ).order_by().values('post').annotate(
+                    total=Count('pk')
+                ).values('total')
+            ),
+            0
+        )
+        with transaction.atomic():
+            drifted = Post.objects.exclude(comment_count=actual)
+            if options['dry_run']:
+                fixed = drifted.count()
+            else:
+                fixed = drifted.update(comment_count=actual)
+        if fixed and not options['dry_run']:
+            bump_cards_version()
+            bump_pages_version()
+        self.stdout.write(
+            self.style.SUCCESS(f'Счётчиков с расхождением: {fixed}')
+        )
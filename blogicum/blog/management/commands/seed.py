@@ -0,0 +1,211 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import capfirst
+from faker import Faker
+
+from blog.caching import (
+    bump_feeds_version, bump_pages_version, bump_post_counts_version
+)
+from blog.cards import bump_cards_version
+from blog.models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+POOL_SIZE = 5000
+HISTORY_DAYS = 365 * 3
+SCHEDULE_DAYS = 30
+
+
+class Command(BaseCommand):
+    help = 'Заполняет базу детерминированным набором тестовых данных.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=50)
+        parser.add_argument('--locations', type=int, default=200)
+        parser.add_argument('--posts', type=int, default=100_000)
+        parser.add_argument(
+            '--comments-per-post', type=float, default=3,
+            help='Среднее число комментариев у публикации.',
+        )
+        parser.add_argument('--unpublished-ratio', type=float, default=0.05)
+        parser.add_argument('--scheduled-ratio', type=float, default=0.05)
+        parser.add_argument(
+            '--hidden-category-ratio', type=float, default=0.1
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--password', default='blogicum',
+            help='Пароль всех созданных пользователей.',
+        )
+
+    def handle(self, *args, **options):
+        Faker.seed(options['seed'])
+        self.fake = Faker('ru_RU')
+        self.rnd = random.Random(options['seed'])
+        self.options = options
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.words = [self.fake.word() for _ in range(POOL_SIZE)]
+        self.sentences = [self.fake.sentence() for _ in range(POOL_SIZE)]
+
+        started = time.perf_counter()
+        total = 0
+        users = self.seed_model(User, options['users'], self.build_user)
+        categories = self.seed_model(
+            Category, options['categories'], self.build_category
+        )
+        locations = self.seed_model(
+            Location, options['locations'], self.build_location
+        )
+        self.user_ids, self.category_ids, self.location_ids = (
+            users, categories, locations
+        )
+        posts = self.seed_model(Post, options['posts'], self.build_post)
+        self.post_ids = posts
+        total += len(users) + len(categories) + len(locations) + len(posts)
+        total += self.seed_comments(posts)
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        bump_cards_version()
+        bump_pages_version()
+        bump_feeds_version()
+        bump_post_counts_version()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Всего строк: {total} за {elapsed:.1f} с'
+            f' ({total / elapsed:.0f} строк/с)'
+        ))
+
+    def next_ids(self, model, count):
+        start = (model.objects.aggregate(top=Max('pk'))['top'] or 0) + 1
+        return range(start, start + count)
+
+    def insert(self, model, objects):
+        with transaction.atomic():
+            model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    def seed_model(self, model, count, build):
+        ids = self.next_ids(model, count)
+        started = time.perf_counter()
+        batch = []
+        for pk in ids:
+            batch.append(build(pk))
+            if len(batch) >= self.batch_size:
+                self.insert(model, batch)
+                batch = []
+        if batch:
+            self.insert(model, batch)
+        self.report(model, count, started)
+        return ids
+
+    def report(self, model, count, started):
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(
+            f'{capfirst(model._meta.verbose_name_plural)}: {count}'
+            f' ({count / elapsed:.0f} строк/с)'
+        )
+
+    def text(self, sentences):
+        return ' '.join(self.rnd.choices(self.sentences, k=sentences))
+
+    def build_user(self, pk):
+        if not hasattr(self, 'password_hash'):
+            self.password_hash = make_password(self.options['password'])
+        return User(
+            pk=pk,
+            username=f'{self.rnd.choice(self.words)}_{pk}',
+            first_name=self.rnd.choice(self.words).title(),
+            last_name=self.rnd.choice(self.words).title(),
+            email=f'user{pk}@example.com',
+            password=self.password_hash,
+        )
+
+    def build_category(self, pk):
+        return Category(
+            pk=pk,
+            title=self.rnd.choice(self.words).title(),
+            description=self.text(2),
+            slug=f'category-{pk}',
+            is_published=(
+                self.rnd.random() >= self.options['hidden_category_ratio']
+            ),
+        )
+
+    def build_location(self, pk):
+        return Location(pk=pk, name=self.rnd.choice(self.words).title())
+
+    def build_post(self, pk):
+        roll = self.rnd.random()
+        unpublished = self.options['unpublished_ratio']
+        if roll < self.options['scheduled_ratio']:
+            pub_date = self.now + timedelta(
+                minutes=self.rnd.randint(1, SCHEDULE_DAYS * 24 * 60)
+            )
+        else:
+            pub_date = self.now - timedelta(
+                minutes=self.rnd.randint(1, HISTORY_DAYS * 24 * 60)
+            )
+        return Post(
+            pk=pk,
+            title=self.rnd.choice(self.sentences)[:-1],
+            text=self.text(self.rnd.randint(3, 15)),
+            pub_date=pub_date,
+            is_published=not (
+                self.options['scheduled_ratio'] <= roll
+                < self.options['scheduled_ratio'] + unpublished
+            ),
+            author_id=self.rnd.choice(self.user_ids),
+            category_id=self.rnd.choice(self.category_ids),
+            location_id=(
+                self.rnd.choice(self.location_ids)
+                if self.location_ids and self.rnd.random() < 0.7 else None
+            ),
+        )
+
+    def seed_comments(self, post_ids):
+        started = time.perf_counter()
+        average = self.options['comments_per_post']
+        ids = iter(self.next_ids(Comment, 2 ** 62))
+        created = 0
+        batch, counts = [], {}
+        for post_id in post_ids:
+            count = self.rnd.randint(0, round(average * 2))
+            counts[post_id] = count
+            for _ in range(count):
+                batch.append(Comment(
+                    pk=next(ids),
+                    post_id=post_id,
+                    author_id=self.rnd.choice(self.user_ids),
+                    text=self.text(self.rnd.randint(1, 3)),
+                ))
+            if len(batch) >= self.batch_size:
+                created += self.flush_comments(batch, counts)
+                batch, counts = [], {}
+        created += self.flush_comments(batch, counts)
+        self.report(Comment, created, started)
+        return created
+
+    def flush_comments(self, batch, counts):
+        with transaction.atomic():
+            Comment.objects.bulk_create(batch, batch_size=self.batch_size)
+            by_count = {}
+            for post_id, count in counts.items():
+                if count:
+                    by_count.setdefault(count, []).append(post_id)
+            for count, post_ids in by_count.items():
+                Post.objects.filter(pk__in=post_ids).update(
+                    comment_count=count
+                )
+        return len(batch)
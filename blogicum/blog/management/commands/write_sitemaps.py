@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.sitemaps import INDEX_NAME, SitemapWriter
+
+SITEMAP_MAX_URLS = 50_000
+
+
+class Command(BaseCommand):
+    help = (
+        'Записывает на диск оглавление и файлы карты сайта с публикациями,'
+        ' категориями и профилями.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=settings.SITEMAP_ROOT,
+            help='Каталог карты сайта, по умолчанию SITEMAP_ROOT.',
+        )
+        parser.add_argument(
+            '--base-url',
+            default=settings.SITEMAP_BASE_URL,
+            help='Схема и домен сайта, по умолчанию SITEMAP_BASE_URL.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=SITEMAP_MAX_URLS,
+            help='Адресов в одном файле, не больше 50000 по протоколу.',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        sitemaps = SitemapWriter(
+            options['output'],
+            options['base_url'],
+            min(options['chunk_size'], SITEMAP_MAX_URLS),
+        ).write()
+        total = sum(count for _, _, count in sitemaps)
+        self.stdout.write(self.style.SUCCESS(
+            f'{INDEX_NAME}: файлов {len(sitemaps)}, адресов {total}'
+            f' за {time.perf_counter() - started:.1f} с'
+        ))
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE blog_post_search USING fts5("
+    " title, text, content='blog_post', content_rowid='id',"
+    " tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO blog_post_search(blog_post_search, rank)"
+    " VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "CREATE TRIGGER blog_post_search_insert AFTER INSERT ON blog_post BEGIN"
+    " INSERT INTO blog_post_search(rowid, title, text)"
+    " VALUES (new.id, new.title, new.text); END",
+    "CREATE TRIGGER blog_post_search_delete AFTER DELETE ON blog_post BEGIN"
+    " INSERT INTO blog_post_search(blog_post_search, rowid, title, text)"
+    " VALUES ('delete', old.id, old.title, old.text); END",
+    "CREATE TRIGGER blog_post_search_update"
+    " AFTER UPDATE OF title, text ON blog_post BEGIN"
+    " INSERT INTO blog_post_search(blog_post_search, rowid, title, text)"
+    " VALUES ('delete', old.id, old.title, old.text);"
+    " INSERT INTO blog_post_search(rowid, title, text)"
+    " VALUES (new.id, new.title, new.text); END",
+    "INSERT INTO blog_post_search(blog_post_search) VALUES ('rebuild')",
+]
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS blog_post_search_insert',
+    'DROP TRIGGER IF EXISTS blog_post_search_delete',
+    'DROP TRIGGER IF EXISTS blog_post_search_update',
+    'DROP TABLE IF EXISTS blog_post_search',
+]
+
+
+def run_sql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_post_image_variants'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_sql(CREATE_SQL), run_sql(DROP_SQL)),
+    ]
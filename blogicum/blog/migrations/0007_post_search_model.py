@@ -0,0 +1,27 @@
+# Generated by Django 3.2.16 on 2026-10-18 08:16
+
+import blog.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearch',
+            fields=[
+                ('post', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_entry', serialize=False, to='blog.post')),
+                ('document', blog.search.SearchDocumentField(db_column='blog_post_search')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'blog_post_search',
+                'managed': False,
+            },
+        ),
+    ]
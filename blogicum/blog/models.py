@@ -1,6 +1,11 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
+
+from .search import (
+    SEARCH_TABLE, SearchDocumentField, build_match, search_available
+)
 
 MAX_CHAR_LENGTH = 256
 
@@ -67,6 +72,29 @@ class Location(AbstractModel):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+
+    def published(self):
+        return self.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now()
+        )
+
+    def search(self, query):
+        match = build_match(query)
+        if not match:
+            return self.none()
+        if not search_available(self.db):
+            return self.filter(
+                models.Q(title__icontains=query)
+                | models.Q(text__icontains=query)
+            )
+        return self.filter(search_entry__document__match=match).annotate(
+            search_rank=models.F('search_entry__rank')
+        ).order_by('search_rank')
+
+
 class Post(AbstractModel):
 
     title = models.CharField(
@@ -100,6 +128,12 @@ class Post(AbstractModel):
 
     image = models.ImageField('Фото', upload_to='posts_images', blank=True)
 
+    image_variants = models.JSONField(
+        default=dict,
+        editable=False,
+        verbose_name='Уменьшенные копии фото'
+    )
+
     category = models.ForeignKey(
         Category,
         verbose_name='Категория',
@@ -108,18 +142,109 @@ class Post(AbstractModel):
         null=True,
     )
 
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
+
+    # Не auto_now: при загрузке фикстур и дампов save() не вызывается, и
+    # столбцу без значения по умолчанию нечем заполниться.
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        db_index=True,
+        verbose_name='Изменено'
+    )
+
+    objects = PostQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ['-pub_date']
+        indexes = [
+            models.Index(
+                fields=['pub_date'],
+                name='post_published_date_idx',
+                condition=models.Q(is_published=True)
+            ),
+            models.Index(
+                fields=['category', 'pub_date'],
+                name='post_category_date_idx',
+                condition=models.Q(is_published=True)
+            ),
+            models.Index(
+                fields=['author', 'pub_date'],
+                name='post_author_date_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.updated_at = timezone.now()
+        if (
+            not self._state.adding
+            and self.pk is not None
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'comment_count'
+            ]
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         return reverse('blog:detail', kwargs={'pk': self.pk})
 
+    def _image_srcset(self, key):
+        storage = self.image.storage
+        sources = [
+            f'{storage.url(size[key])} {size["width"]}w'
+            for size in self.image_variants.get('sizes', [])
+        ]
+        original = (
+            self.image_variants['webp'] if key == 'webp' else self.image.name
+        )
+        sources.append(
+            f'{storage.url(original)} {self.image_variants["width"]}w'
+        )
+        return ', '.join(sources)
+
+    @property
+    def image_srcset(self):
+        if self.image and self.image_variants:
+            return self._image_srcset('fallback')
+        return ''
+
+    @property
+    def image_webp_srcset(self):
+        if self.image and self.image_variants:
+            return self._image_srcset('webp')
+        return ''
+
     def __str__(self) -> str:
         return self.title
 
 
+class PostSearch(models.Model):
+    # Виртуальную таблицу FTS5 создаёт миграция 0005, Django ею не
+    # управляет; модель нужна, чтобы присоединять её к публикациям.
+    post = models.OneToOneField(
+        Post,
+        primary_key=True,
+        db_column='rowid',
+        on_delete=models.DO_NOTHING,
+        related_name='search_entry',
+    )
+    document = SearchDocumentField(db_column=SEARCH_TABLE)
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = SEARCH_TABLE
+
+
 class Comment(models.Model):
     text = models.TextField('Напишите комментарий')
     post = models.ForeignKey(
@@ -138,6 +263,12 @@ class Comment(models.Model):
         ordering = ('-created_at',)
         verbose_name = 'комментарий'
         verbose_name_plural = 'комментарии'
+        indexes = [
+            models.Index(
+                fields=['post', 'created_at'],
+                name='comment_post_created_idx'
+            ),
+        ]
 
     def __str__(self) -> str:
         return (f'Объект : {self._meta.verbose_name.capitalize()}'
@@ -0,0 +1,185 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+from django.http import Http404
+from django.utils.functional import cached_property
+
+from .caching import POST_COUNT_VERSION_KEY, get_version
+
+OFFSET_MODE = 'offset'
+KEYSET_MODE = 'keyset'
+
+
+def encode_cursor(obj, field='pub_date'):
+    raw = f'{getattr(obj, field).isoformat()}|{obj.pk}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    padded = token + '=' * (-len(token) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        value, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(value), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise Http404
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(self, object_list, has_next, has_previous,
+                 field='pub_date'):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.field = field
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if self.has_next():
+            return encode_cursor(self.object_list[-1], self.field)
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous():
+            return encode_cursor(self.object_list[0], self.field)
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page, field='pub_date',
+                 descending=True):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.field = field
+        self.descending = descending
+
+    def seek(self, queryset, cursor, forward):
+        value, pk = decode_cursor(cursor)
+        lookup = 'lt' if forward == self.descending else 'gt'
+        return queryset.filter(
+            Q(**{f'{self.field}__{lookup}': value})
+            | Q(**{self.field: value, f'pk__{lookup}': pk})
+        )
+
+    def order(self, queryset, forward):
+        prefix = '-' if forward == self.descending else ''
+        return queryset.order_by(f'{prefix}{self.field}', f'{prefix}pk')
+
+    def page(self, after=None, before=None):
+        queryset = self.queryset
+        if before:
+            queryset = self.seek(queryset, before, forward=False)
+            rows = list(
+                self.order(queryset, forward=False)[:self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            rows.reverse()
+            return KeysetPage(
+                rows, has_next=True, has_previous=has_previous,
+                field=self.field,
+            )
+
+        if after:
+            queryset = self.seek(queryset, after, forward=True)
+        rows = list(self.order(queryset, forward=True)[:self.per_page + 1])
+        return KeysetPage(
+            rows[:self.per_page],
+            has_next=len(rows) > self.per_page,
+            has_previous=bool(after),
+            field=self.field,
+        )
+
+
+class WindowedPage(Page):
+
+    @property
+    def window(self):
+        return self.paginator.get_elided_page_range(
+            self.number, on_each_side=2, on_ends=1
+        )
+
+
+class WindowedPaginator(Paginator):
+
+    def __init__(self, *args, count_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_key = count_key
+
+    @cached_property
+    def count(self):
+        if self.count_key is None:
+            return super().count
+        version = get_version(POST_COUNT_VERSION_KEY)
+        key = f'post_count:{version}:{self.count_key}'
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, settings.POSTS_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def page(self, number):
+        # Число публикаций может быть устаревшим, поэтому срез страницы
+        # не обрезается по нему.
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom:bottom + self.per_page], number, self
+        )
+
+    def _get_page(self, *args, **kwargs):
+        return WindowedPage(*args, **kwargs)
+
+
+class KeysetPaginationMixin:
+    pagination_mode = None
+    paginator_class = WindowedPaginator
+
+    def get_count_key(self):
+        return None
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        return super().get_paginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            count_key=self.get_count_key(), **kwargs
+        )
+
+    def get_pagination_mode(self):
+        return self.pagination_mode or getattr(
+            settings, 'POSTS_PAGINATION_MODE', OFFSET_MODE
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() != KEYSET_MODE:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size)
+        page = paginator.page(
+            after=self.request.GET.get('after'),
+            before=self.request.GET.get('before'),
+        )
+        return (paginator, page, page.object_list, page.has_other_pages())
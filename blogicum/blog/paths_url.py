@@ -1,12 +1,13 @@
 from django.urls import path
 
 from . import views
+from .async_views import read_only_view
 
 
 urlpatterns = [
 
     path('<int:post_id>/',
-         views.PostDetailView.as_view(),
+         read_only_view(views.PostDetailView),
          name='post_detail'),
 
     path('<int:post_id>/edit/',
@@ -21,6 +22,9 @@ urlpatterns = [
          views.PostCreateView.as_view(),
          name='create_post'),
 
+    path('<int:post_id>/comments/',
+         read_only_view(views.PostCommentsView), name='post_comments'),
+
     path('<int:post_id>/comment/',
          views.CommentCreateView.as_view(), name='add_comment'),
 
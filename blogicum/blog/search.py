@@ -0,0 +1,91 @@
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+SEARCH_TABLE = 'blog_post_search'
+MAX_TERMS = 8
+TERM_RE = re.compile(r'\w+')
+
+# Таблицы на SQLite Django пересоздаёт при изменении схемы, а вместе с ними
+# удаляются и триггеры, поэтому они восстанавливаются после каждой миграции.
+TRIGGERS = (
+    f'''CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert
+    AFTER INSERT ON blog_post BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END''',
+    f'''CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete
+    AFTER DELETE ON blog_post BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+    END''',
+    f'''CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update
+    AFTER UPDATE OF title, text ON blog_post BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+        INSERT INTO {SEARCH_TABLE}(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END''',
+)
+
+
+# Наличие таблицы поиска проверяется один раз для каждой базы, а не на
+# каждый запрос; после миграций проверка повторяется.
+available = {}
+
+
+class SearchDocumentField(models.TextField):
+    pass
+
+
+@SearchDocumentField.register_lookup
+class Match(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+def search_available(using=DEFAULT_DB_ALIAS, refresh=False):
+    if refresh or using not in available:
+        connection = connections[using]
+        if connection.vendor != 'sqlite':
+            available[using] = False
+        else:
+            with connection.cursor() as cursor:
+                available[using] = (
+                    SEARCH_TABLE in connection.introspection.table_names(
+                        cursor
+                    )
+                )
+    return available[using]
+
+
+def build_match(query):
+    terms = TERM_RE.findall(query.lower())[:MAX_TERMS]
+    if not terms:
+        return ''
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def install_triggers(using=DEFAULT_DB_ALIAS):
+    if not search_available(using, refresh=True):
+        return
+    with connections[using].cursor() as cursor:
+        for trigger in TRIGGERS:
+            cursor.execute(trigger)
+
+
+def rebuild_index(using=DEFAULT_DB_ALIAS):
+    install_triggers(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+        )
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')"
+        )
@@ -0,0 +1,139 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_out
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_migrate, post_save, pre_save
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .auth import cache_user, invalidate_user
+from .caching import (
+    bump_feeds_version, bump_pages_version, bump_post_counts_version
+)
+from .cards import bump_cards_version
+from .models import Category, Comment, Location, Post
+from .search import install_triggers
+
+User = get_user_model()
+
+# Поля пользователя, которые выводятся в карточках, лентах и профиле.
+DISPLAYED_USER_FIELDS = ('username', 'first_name', 'last_name')
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1, updated_at=timezone.now()
+        )
+
+
+@receiver(post_save, sender=Comment)
+def touch_commented_post(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        Post.objects.filter(pk=instance.post_id).update(
+            updated_at=timezone.now()
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(
+        pk=instance.post_id, comment_count__gt=0
+    ).update(
+        comment_count=F('comment_count') - 1, updated_at=timezone.now()
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_all_cards(sender, **kwargs):
+    bump_cards_version()
+
+
+@receiver(pre_save, sender=User)
+def detect_displayed_user_changes(
+        sender, instance, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        instance._displayed_fields_changed = True
+    elif instance._state.adding or (
+        update_fields is not None
+        and not set(update_fields) & set(DISPLAYED_USER_FIELDS)
+    ):
+        instance._displayed_fields_changed = False
+    else:
+        saved = User.objects.filter(pk=instance.pk).values_list(
+            *DISPLAYED_USER_FIELDS
+        ).first()
+        instance._displayed_fields_changed = saved != tuple(
+            getattr(instance, field) for field in DISPLAYED_USER_FIELDS
+        )
+
+
+@receiver(post_save, sender=User)
+def invalidate_cards_of_author(sender, instance, created, **kwargs):
+    # Регистрация, вход и смена пароля не меняют отрисованных страниц.
+    if created or not instance._displayed_fields_changed:
+        return
+    bump_cards_version()
+    bump_pages_version()
+    bump_feeds_version()
+
+
+@receiver(post_save, sender=User)
+def refresh_cached_user(sender, instance, update_fields=None, **kwargs):
+    # При входе сохраняется только last_login, и объект пользователя
+    # только что прочитан из базы, поэтому его можно сразу положить в кэш.
+    if update_fields and set(update_fields) == {'last_login'}:
+        cache_user(instance)
+    else:
+        invalidate_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(user_logged_out)
+def forget_logged_out_user(sender, user, **kwargs):
+    if user is not None:
+        invalidate_user(user.pk)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_pages(sender, **kwargs):
+    bump_pages_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_post_counts(sender, **kwargs):
+    bump_post_counts_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_feeds(sender, **kwargs):
+    bump_feeds_version()
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    if sender.name == 'blog':
+        install_triggers(using)
@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+from xml.sax.saxutils import escape
+
+from django.contrib.auth import get_user_model
+from django.db.models import OuterRef, Subquery
+from django.urls import reverse
+
+from .models import Category, Post
+
+User = get_user_model()
+
+INDEX_NAME = 'sitemap.xml'
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+ITERATOR_CHUNK_SIZE = 2000
+
+
+def newest_pub_date(**filters):
+    return Subquery(
+        Post.objects.published().filter(**filters)
+        .order_by('-pub_date').values('pub_date')[:1]
+    )
+
+
+def category_urls():
+    rows = Category.objects.filter(is_published=True).annotate(
+        lastmod=newest_pub_date(category=OuterRef('pk'))
+    ).order_by('pk').values_list('slug', 'lastmod')
+    for slug, lastmod in rows.iterator(ITERATOR_CHUNK_SIZE):
+        yield reverse('blog:category_posts', kwargs={'slug': slug}), lastmod
+
+
+def profile_urls():
+    rows = User.objects.annotate(
+        lastmod=newest_pub_date(author=OuterRef('pk'))
+    ).filter(lastmod__isnull=False).order_by('pk').values_list(
+        'username', 'lastmod'
+    )
+    for username, lastmod in rows.iterator(ITERATOR_CHUNK_SIZE):
+        yield reverse('blog:profile', kwargs={'username': username}), lastmod
+
+
+# Страницы публикаций доступны только после входа, поэтому поисковым
+# роботам отдаются лишь открытые разделы.
+SECTIONS = {
+    'categories': category_urls,
+    'profiles': profile_urls,
+}
+
+
+def format_lastmod(date):
+    return date.isoformat(timespec='seconds')
+
+
+class SitemapWriter:
+
+    def __init__(self, directory, base_url, chunk_size):
+        self.directory = directory
+        self.base_url = base_url.rstrip('/')
+        self.chunk_size = chunk_size
+
+    def write(self):
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+        try:
+            sitemaps = []
+            for section, urls in SECTIONS.items():
+                sitemaps.extend(self.write_section(staging, section, urls()))
+            names = [name for name, _, _ in sitemaps] + [INDEX_NAME]
+            self.write_index(staging, sitemaps)
+            # Оглавление переносится последним, чтобы оно не ссылалось на
+            # ещё не записанные файлы.
+            for name in names:
+                os.replace(
+                    os.path.join(staging, name),
+                    os.path.join(self.directory, name),
+                )
+            for name in os.listdir(self.directory):
+                if name.startswith('sitemap-') and name not in names:
+                    os.remove(os.path.join(self.directory, name))
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return sitemaps
+
+    def write_section(self, directory, section, urls):
+        sitemaps, stream = [], None
+        name, newest, count = None, None, 0
+        for location, lastmod in urls:
+            if stream is None or count >= self.chunk_size:
+                if stream is not None:
+                    self.close(stream, '</urlset>\n')
+                    sitemaps.append((name, newest, count))
+                name = f'sitemap-{section}-{len(sitemaps) + 1}.xml'
+                stream = self.open(directory, name, 'urlset')
+                count, newest = 0, None
+            stream.write(f'<url><loc>{escape(self.base_url + location)}</loc>')
+            if lastmod is not None:
+                stream.write(f'<lastmod>{format_lastmod(lastmod)}</lastmod>')
+                newest = max(newest or lastmod, lastmod)
+            stream.write('</url>\n')
+            count += 1
+        if stream is not None:
+            self.close(stream, '</urlset>\n')
+            sitemaps.append((name, newest, count))
+        return sitemaps
+
+    def write_index(self, directory, sitemaps):
+        stream = self.open(directory, INDEX_NAME, 'sitemapindex')
+        for name, lastmod, _ in sitemaps:
+            location = escape(
+                self.base_url + reverse('sitemap', kwargs={'path': name})
+            )
+            stream.write(f'<sitemap><loc>{location}</loc>')
+            if lastmod is not None:
+                stream.write(f'<lastmod>{format_lastmod(lastmod)}</lastmod>')
+            stream.write('</sitemap>\n')
+        self.close(stream, '</sitemapindex>\n')
+
+    def open(self, directory, name, root):
+        stream = open(os.path.join(directory, name), 'w', encoding='utf-8')
+        stream.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<{root} xmlns="{SITEMAP_NAMESPACE}">\n'
+        )
+        return stream
+
+    def close(self, stream, footer):
+        stream.write(footer)
+        stream.close()
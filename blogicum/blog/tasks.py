@@ -0,0 +1,11 @@
+from tasks.queue import task
+
+from .images import generate_post_thumbnails
+from .models import Post
+
+
+@task(cpu_bound=True)
+def make_post_thumbnails(post_id):
+    post = Post.objects.filter(pk=post_id).first()
+    if post is not None:
+        generate_post_thumbnails(post)
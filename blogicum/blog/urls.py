@@ -1,24 +1,47 @@
 from django.urls import path, include
 
-from . import views
+from . import feeds, views
+from .async_views import read_only_view
 
 
 app_name = 'blog'
 
 urlpatterns = [
-    path('', views.PostListView.as_view(), name='index'),
+    path('', read_only_view(views.PostListView), name='index'),
+
+    path('feeds/rss/', feeds.PostsFeed(), name='feed_rss'),
+
+    path('feeds/atom/', feeds.AtomPostsFeed(), name='feed_atom'),
 
     path('profile/<str:username>/',
-         views.ProfileDetailView.as_view(),
+         read_only_view(views.ProfileDetailView),
          name='profile'),
 
+    path('profile/<str:username>/rss/',
+         feeds.AuthorPostsFeed(),
+         name='author_feed_rss'),
+
+    path('profile/<str:username>/atom/',
+         feeds.AtomAuthorPostsFeed(),
+         name='author_feed_atom'),
+
     path('edit/',
          views.ProfileEditView.as_view(),
          name='edit_profile'),
 
     path('posts/', include('blog.paths_url')),
 
+    path('search/', read_only_view(views.PostSearchView), name='search'),
+
     path('category/<slug:slug>/',
-         views.PostCategoryListView.as_view(),
+         read_only_view(views.PostCategoryListView),
          name='category_posts'),
+
+    path('category/<slug:slug>/rss/',
+         feeds.CategoryPostsFeed(),
+         name='category_feed_rss'),
+
+    path('category/<slug:slug>/atom/',
+         feeds.AtomCategoryPostsFeed(),
+         name='category_feed_atom'),
 ]
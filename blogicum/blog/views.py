@@ -1,5 +1,7 @@
 from typing import Any
+from urllib.parse import urlencode
 
+from django.conf import settings
 from django.views.generic import (
     ListView, CreateView, UpdateView, DetailView, DeleteView
 )
@@ -9,15 +11,23 @@ from django.db.models.query import QuerySet
 from django.shortcuts import get_object_or_404, redirect
 from django.http import Http404
 from django.contrib.auth import get_user_model
-from django.db.models import Count
 from django.utils import timezone
+from django.views.static import serve
 
 from .models import Post, Comment, Category
+from .caching import AnonymousPageCacheMixin
+from .conditional import ConditionalGetMixin, PostFeedConditionalGetMixin
 from .forms import PostForm, CommentForm
+from .pagination import (
+    KeysetPaginationMixin, KeysetPaginator, WindowedPaginator
+)
+from .tasks import make_post_thumbnails
 
 User = get_user_model()
 
 POSTS_PER_PAGE = 10
+COMMENTS_PER_PAGE = 20
+SEARCH_QUERY_MAX_LENGTH = 200
 
 
 def accuire_querry(filtered=False, need_comments=False):
@@ -27,25 +37,41 @@ def accuire_querry(filtered=False, need_comments=False):
     )
 
     if filtered:
-        req = req.filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        )
+        req = req.published()
     if need_comments:
-        req = req.annotate(
-            comment_count=Count('comments')
-        ).order_by(
+        req = req.order_by(
             '-pub_date'
         )
     return req
 
 
-class PermissionMixin(UserPassesTestMixin):
+class ObjectCacheMixin:
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return self.fetch_object(queryset)
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = self.fetch_object()
+        return self._cached_object
+
+    def fetch_object(self, queryset=None):
+        return super().get_object(queryset)
+
+
+class PermissionMixin(ObjectCacheMixin, UserPassesTestMixin):
 
     def test_func(self):
         object = self.get_object()
-        return object.author == self.request.user
+        return object.author_id == self.request.user.pk
+
+
+class PostImageMixin:
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        if 'image' in form.changed_data:
+            make_post_thumbnails.delay(self.object.pk)
+        return response
 
 
 class CommentMixin:
@@ -53,6 +79,9 @@ class CommentMixin:
     form_class = CommentForm
     pk_url_kwarg = 'comment_id'
 
+    def get_queryset(self):
+        return super().get_queryset().filter(post_id=self.kwargs['post_id'])
+
     def get_success_url(self):
         return reverse(
             'blog:post_detail', kwargs={'post_id': self.kwargs['post_id']}
@@ -62,34 +91,47 @@ class CommentMixin:
 class CommentDispatchMixin:
 
     def dispatch(self, request, *args, **kwargs):
-        get_object_or_404(
-            Comment, pk=kwargs['comment_id'], post_id=kwargs['post_id']
-        )
+        self.get_object()
         return super().dispatch(request, *args, **kwargs)
 
 
-class PostListView(ListView):
+class PostListView(
+    AnonymousPageCacheMixin, PostFeedConditionalGetMixin,
+    KeysetPaginationMixin, ListView
+):
     form_class = PostForm
     paginate_by = POSTS_PER_PAGE
     template_name = 'blog/index.html'
-    queryset = accuire_querry(
-        filtered=True, need_comments=True
-    )
+
+    def get_queryset(self) -> QuerySet[Any]:
+        return accuire_querry(filtered=True, need_comments=True)
+
+    def get_count_key(self):
+        return 'index'
 
 
-class PostCategoryListView(ListView):
+class PostCategoryListView(
+    AnonymousPageCacheMixin, ObjectCacheMixin, PostFeedConditionalGetMixin,
+    KeysetPaginationMixin, ListView
+):
     form_class = PostForm
     template_name = 'blog/category.html'
     paginate_by = POSTS_PER_PAGE
 
-    def get_category(self):
+    def fetch_object(self, queryset=None):
         return get_object_or_404(
             Category, slug=self.kwargs['slug'], is_published=True
         )
 
+    def get_category(self):
+        return self.get_object()
+
+    def get_count_key(self):
+        return f'category:{self.get_category().pk}'
+
     def get_queryset(self) -> QuerySet[Any]:
         return accuire_querry(filtered=True, need_comments=True).filter(
-            category__slug=self.get_category().slug
+            category=self.get_category()
         )
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
@@ -99,13 +141,30 @@ class PostCategoryListView(ListView):
         return context
 
 
-class PostCreateView(LoginRequiredMixin, CreateView):
+class PostSearchView(ListView):
+    template_name = 'blog/search.html'
+    paginate_by = POSTS_PER_PAGE
+    paginator_class = WindowedPaginator
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()[:SEARCH_QUERY_MAX_LENGTH]
+
+    def get_queryset(self) -> QuerySet[Any]:
+        return accuire_querry(filtered=True).search(self.get_search_query())
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_search_query()
+        context['page_query'] = urlencode({'q': context['query']}) + '&'
+        return context
+
+
+class PostCreateView(LoginRequiredMixin, PostImageMixin, CreateView):
     model = Post
     form_class = PostForm
     template_name = 'blog/create.html'
 
     def form_valid(self, form):
-        form.save()
         form.instance.author = self.request.user
         return super().form_valid(form)
 
@@ -118,7 +177,7 @@ class PostCreateView(LoginRequiredMixin, CreateView):
 
 
 class PostUpdateView(
-    LoginRequiredMixin, PermissionMixin, UpdateView
+    LoginRequiredMixin, PermissionMixin, PostImageMixin, UpdateView
 ):
     model = Post
     form_class = PostForm
@@ -152,21 +211,23 @@ class PostDeleteView(
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context['form'] = PostForm(
-            instance=get_object_or_404(Post, pk=kwargs['post_id']),
+            instance=self.object,
             files=self.request.FILES or None
         )
         return context
 
 
-class PostDetailView(LoginRequiredMixin, DetailView):
+class PostDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, ObjectCacheMixin, DetailView
+):
     form_class = CommentForm
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
     queryset = accuire_querry(False, False)
 
-    def get_object(self):
+    def fetch_object(self, queryset=None):
 
-        post = get_object_or_404(Post, pk=self.kwargs['post_id'])
+        post = super().fetch_object(queryset)
 
         access_denied = True if post.author != self.request.user else False
         post_hidden = True if not post.is_published else False
@@ -178,19 +239,30 @@ class PostDetailView(LoginRequiredMixin, DetailView):
 
         return post
 
+    def get_validators(self):
+        post = self.get_object()
+        return post.updated_at, (post.pk,)
+
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = Comment.objects.select_related(
-            'author'
-        ).filter(
-            post_id=self.get_object().pk
-        ).order_by(
-            'created_at'
-        )
+        context['comments'] = KeysetPaginator(
+            Comment.objects.select_related(
+                'author'
+            ).filter(
+                post_id=self.object.pk
+            ),
+            COMMENTS_PER_PAGE,
+            field='created_at',
+            descending=False,
+        ).page(after=self.request.GET.get('after'))
         return context
 
 
+class PostCommentsView(PostDetailView):
+    template_name = 'includes/comment_list.html'
+
+
 class CommentCreateView(LoginRequiredMixin, CommentMixin, CreateView):
 
     def form_valid(self, form):
@@ -226,23 +298,34 @@ class CommentDeleteView(
     pk_url_kwarg = 'comment_id'
 
 
-class ProfileDetailView(ListView):
+class ProfileDetailView(
+    ObjectCacheMixin, PostFeedConditionalGetMixin, KeysetPaginationMixin,
+    ListView
+):
     model = User
     template_name = 'blog/profile.html'
     paginate_by = POSTS_PER_PAGE
 
-    def get_object(self):
+    def fetch_object(self, queryset=None):
         return get_object_or_404(User, username=self.kwargs.get('username'))
 
+    def is_own_profile(self):
+        return self.get_object() == self.request.user
+
     def get_queryset(self) -> QuerySet[Any]:
+        profile = self.get_object()
 
         return accuire_querry(
-            filtered=self.get_object() != self.request.user,
+            filtered=not self.is_own_profile(),
             need_comments=True
         ).filter(
-            author__username=self.get_object().username
+            author=profile
         )
 
+    def get_count_key(self):
+        visibility = 'all' if self.is_own_profile() else 'published'
+        return f'profile:{self.get_object().pk}:{visibility}'
+
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data()
         context['profile'] = self.get_object()
@@ -260,3 +343,9 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
 
     def get_object(self):
         return self.request.user
+
+
+def sitemap(request, path):
+    # Файлы пишет команда write_sitemaps; в продакшене каталог
+    # SITEMAP_ROOT лучше отдавать веб-сервером.
+    return serve(request, path, document_root=settings.SITEMAP_ROOT)
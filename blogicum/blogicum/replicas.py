@@ -0,0 +1,81 @@
+import asyncio
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY_COOKIE = 'primary_reads'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+read_alias = ContextVar('read_alias', default=DEFAULT_DB_ALIAS)
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        return read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def use_replica(self, request):
+        return (
+            request.method in SAFE_METHODS
+            and PRIMARY_COOKIE not in request.COOKIES
+        )
+
+    def choose_alias(self, request):
+        if self.use_replica(request):
+            return random.choice(list(settings.DATABASE_REPLICAS))
+        return DEFAULT_DB_ALIAS
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        token = read_alias.set(self.choose_alias(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            read_alias.reset(token)
+        return self.pin_primary(request, response)
+
+    async def __acall__(self, request):
+        token = read_alias.set(self.choose_alias(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_alias.reset(token)
+        return self.pin_primary(request, response)
+
+    def pin_primary(self, request, response):
+        if request.method not in SAFE_METHODS:
+            # Реплики отстают от основной базы, поэтому сразу после записи
+            # автор читает её результат из основной базы.
+            response.set_cookie(
+                PRIMARY_COOKIE, '1',
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True, samesite='Lax',
+            )
+        return response
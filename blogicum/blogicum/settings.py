@@ -1,3 +1,5 @@
+import os
+import tempfile
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -13,9 +15,13 @@ ALLOWED_HOSTS = []
 
 MEDIA_ROOT = BASE_DIR / 'media'
 
+POST_IMAGE_WIDTHS = (320, 640, 1280)
+
 INSTALLED_APPS = [
     'pages.apps.PagesConfig',
     'blog.apps.BlogConfig',
+    'tasks.apps.TasksConfig',
+    'perf.apps.PerfConfig',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -26,6 +32,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'perf.middleware.PerfMiddleware',
+    'blogicum.replicas.ReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -37,6 +45,8 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'blogicum.urls'
 
+ASYNC_READ_VIEWS = os.environ.get('BLOGICUM_ASYNC_READ_VIEWS') == '1'
+
 TEMPLATES_PATH = 'templates'
 
 TEMPLATES_DIR = BASE_DIR / TEMPLATES_PATH
@@ -45,6 +55,21 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
+TASKS_EAGER = False
+
+TASKS_RETRY_BACKOFF = 10
+
+TASKS_LOCK_TIMEOUT = 60 * 10
+
+PERF_MONITORING = False
+
+PERF_STATS_DIR = BASE_DIR / 'perf_stats'
+
+PERF_FLUSH_INTERVAL = 30
+
+# Снимки старше суток остаются от завершившихся воркеров и удаляются.
+PERF_STATS_MAX_AGE = 60 * 60 * 24
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -63,13 +88,49 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
+DATABASE_PROFILE = 'development'
+
+DATABASE_PROFILES = {
+    'development': {},
+    'production': {
+        'CONN_MAX_AGE': 60 * 10,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'pragmas': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'busy_timeout': 5000,
+                'mmap_size': 256 * 1024 * 1024,
+                'cache_size': -64 * 1024,
+                'temp_store': 'MEMORY',
+            },
+        },
+    },
+}
+
+DATABASE_REPLICAS = {}
+
+READ_YOUR_WRITES_SECONDS = 10
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'blogicum.sqlite',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        **DATABASE_PROFILES[DATABASE_PROFILE],
+    },
+    **{
+        alias: {
+            'ENGINE': 'blogicum.sqlite',
+            'NAME': name,
+            'TEST': {'MIRROR': 'default'},
+            **DATABASE_PROFILES[DATABASE_PROFILE],
+        }
+        for alias, name in DATABASE_REPLICAS.items()
+    },
 }
 
+DATABASE_ROUTERS = ['blogicum.replicas.ReplicaRouter']
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -99,6 +160,93 @@ STATIC_URL = '/static/'
 
 STATICFILES_DIRS = [BASE_DIR / 'static_dev']
 
+STATIC_ROOT = BASE_DIR / 'static'
+
+STATICFILES_STORAGE = (
+    'blogicum.staticfiles.CompressedManifestStaticFilesStorage'
+)
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
+
+POSTS_PAGINATION_MODE = 'offset'
+
+POSTS_COUNT_CACHE_TIMEOUT = 60
+
+POST_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+PAGE_CACHE_ENABLED = True
+
+PAGE_CACHE_ALIAS = 'pages'
+
+PAGE_CACHE_TIMEOUT = 60 * 5
+
+FEED_CACHE_TIMEOUT = 60 * 60 * 24
+
+SITEMAP_ROOT = BASE_DIR / 'sitemaps'
+
+SITEMAP_BASE_URL = 'http://127.0.0.1:8000'
+
+# Метки версий кэшей (карточек, счётчиков публикаций, страниц, лент и
+# ETag) сдвигают все процессы: веб-воркеры, runworker и команды управления,
+# поэтому они хранятся в общем для этих процессов кэше. По умолчанию это
+# файлы на диске; при нескольких серверах нужен memcached, а locmem годится
+# только для единственного процесса.
+SHARED_CACHE_ALIAS = 'shared'
+
+SHARED_CACHE_BACKEND = 'filesystem'
+
+SHARED_CACHE_BACKENDS = {
+    'filesystem': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        # Каталог вне дерева исходников, общий для процессов на этом
+        # сервере; переопределяется переменной окружения.
+        'LOCATION': os.environ.get(
+            'BLOGICUM_SHARED_CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'blogicum-shared-cache'),
+        ),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+    'memcached': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': '127.0.0.1:11211',
+    },
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum-shared',
+    },
+}
+
+# Сессия и снимок пользователя читаются из общего кэша, а в базу сессия
+# по-прежнему записывается. В кэше одного процесса не видны выход из
+# аккаунта и смена пароля в другом, поэтому с locmem сессии и пользователи
+# читаются из базы, как без кэша.
+SESSION_CACHE_ALIAS = SHARED_CACHE_ALIAS
+
+USER_CACHE_TIMEOUT = 60 * 5
+
+if SHARED_CACHE_BACKEND != 'locmem':
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    AUTHENTICATION_BACKENDS = ['blog.auth.CachedModelBackend']
+
+PAGE_CACHE_BACKEND = 'locmem'
+
+PAGE_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum-pages',
+    },
+    'filesystem': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'page_cache',
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    PAGE_CACHE_ALIAS: PAGE_CACHE_BACKENDS[PAGE_CACHE_BACKEND],
+    SHARED_CACHE_ALIAS: SHARED_CACHE_BACKENDS[SHARED_CACHE_BACKEND],
+}
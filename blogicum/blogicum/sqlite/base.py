@@ -0,0 +1,29 @@
+from django.db.backends.sqlite3 import base
+
+BACKEND_OPTIONS = ('pragmas', 'transaction_mode')
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        for option in BACKEND_OPTIONS:
+            params.pop(option, None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+        pragmas = self.settings_dict['OPTIONS'].get('pragmas', {})
+        for name, value in pragmas.items():
+            connection.execute(f'PRAGMA {name} = {value}')
+        return connection
+
+    def _start_transaction_under_autocommit(self):
+        # Отложенная транзакция получает блокировку на запись только при
+        # первой записи и при конкуренции сразу падает с «database is
+        # locked», не дожидаясь busy_timeout.
+        mode = self.settings_dict['OPTIONS'].get('transaction_mode')
+        if mode:
+            self.cursor().execute(f'BEGIN {mode}')
+        else:
+            super()._start_transaction_under_autocommit()
@@ -0,0 +1,117 @@
+import gzip
+import mimetypes
+import posixpath
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import (
+    ManifestStaticFilesStorage, staticfiles_storage
+)
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    '.css', '.js', '.svg', '.ico', '.txt', '.xml', '.json', '.map'
+)
+MIN_COMPRESS_SIZE = 256
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def compressors():
+    yield '.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield '.br', lambda data: brotli.compress(data, quality=11)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # До collectstatic нет ни манифеста, ни собранных файлов, поэтому
+            # при разработке и в тестах ссылки ведут на исходные имена.
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            yield name, hashed_name, processed
+            if dry_run or not hashed_name or isinstance(processed, Exception):
+                continue
+            for path in {name, hashed_name}:
+                self.compress(path)
+
+    def compress(self, name):
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+        path = Path(self.path(name))
+        data = path.read_bytes()
+        if len(data) < MIN_COMPRESS_SIZE:
+            return
+        for suffix, compress in compressors():
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                path.with_name(path.name + suffix).write_bytes(compressed)
+
+
+def accepted_encodings(header):
+    encodings = set()
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        quality = params.strip().replace(' ', '')
+        if quality.startswith('q=') and not quality[2:].strip('0.'):
+            continue
+        encodings.add(coding.strip().lower())
+    return encodings
+
+
+def serve_static(request, path):
+    path = posixpath.normpath(path).lstrip('/')
+    fullpath = Path(safe_join(settings.STATIC_ROOT, path))
+    if not fullpath.is_file():
+        raise Http404
+    content_type, _ = mimetypes.guess_type(fullpath.name)
+    accepted = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    served, encoding = fullpath, None
+    for coding, suffix in ENCODINGS:
+        variant = fullpath.with_name(fullpath.name + suffix)
+        if coding in accepted and variant.is_file():
+            served, encoding = variant, coding
+            break
+
+    stat = served.stat()
+    if not was_modified_since(
+        request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime, stat.st_size
+    ):
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(
+            served.open('rb'),
+            content_type=content_type or 'application/octet-stream',
+        )
+        response.headers.pop('Content-Disposition', None)
+        response.headers['Last-Modified'] = http_date(stat.st_mtime)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    # Имя с хешем меняется вместе с содержимым, поэтому такой файл можно
+    # не перепроверять; остальные браузер перепроверяет каждый раз.
+    if path in getattr(staticfiles_storage, 'hashed_files', {}).values():
+        patch_cache_control(
+            response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True
+        )
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
@@ -1,11 +1,18 @@
-from django.urls import include, path, reverse_lazy
+from django.urls import include, path, re_path, reverse_lazy
 
 from django.contrib.auth.forms import UserCreationForm
+from django.views.generic import TemplateView
 from django.views.generic.edit import CreateView
 from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.auth.views import PasswordResetConfirmView
+from django.contrib.auth.views import (
+    PasswordResetConfirmView, PasswordResetView
+)
+
+from blog.forms import QueuedPasswordResetForm
+from blog.views import sitemap
+from .staticfiles import serve_static
 
 AFTER_REGISTRATION_URL = 'blog:index'
 
@@ -17,6 +24,18 @@ urlpatterns = [
     path('profile/', include('blog.urls', namespace='blog')),
     path('pages/', include('pages.urls', namespace='pages')),
     path('admin/', admin.site.urls),
+    path('robots.txt',
+         TemplateView.as_view(
+             template_name='robots.txt', content_type='text/plain'
+         ),
+         name='robots'),
+    re_path(r'^(?P<path>sitemap[-\w]*\.xml)$', sitemap, name='sitemap'),
+    re_path(rf'^{settings.STATIC_URL.lstrip("/")}(?P<path>.+)$',
+            serve_static, name='static'),
+    path('perf/', include('perf.urls', namespace='perf')),
+    path('auth/password_reset/',
+         PasswordResetView.as_view(form_class=QueuedPasswordResetForm),
+         name='password_reset'),
     path('auth/', include('django.contrib.auth.urls')),
 
     path(
@@ -1,9 +1,12 @@
 from django.urls import path
+
+from blog.async_views import read_only_view
+
 from . import views
 
 app_name = 'pages'
 
 urlpatterns = [
-    path('about/', views.AboutPage.as_view(), name='about'),
-    path('rules/', views.RulesPage.as_view(), name='rules'),
+    path('about/', read_only_view(views.AboutPage), name='about'),
+    path('rules/', read_only_view(views.RulesPage), name='rules'),
 ]
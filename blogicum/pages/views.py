@@ -1,13 +1,17 @@
 from django.views.generic import TemplateView
 from django.shortcuts import render
 
+from blog.caching import AnonymousPageCacheMixin
 
-class AboutPage(TemplateView):
+
+class AboutPage(AnonymousPageCacheMixin, TemplateView):
     template_name = 'pages/about.html'
+    publication_aware = False
 
 
-class RulesPage(TemplateView):
+class RulesPage(AnonymousPageCacheMixin, TemplateView):
     template_name = 'pages/rules.html'
+    publication_aware = False
 
 
 def csrf_failure(request, reason=''):
@@ -0,0 +1,42 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from perf.stats import report
+
+COLUMNS = (
+    ('latency_ms', 'p50'), ('latency_ms', 'p95'), ('latency_ms', 'p99'),
+    ('sql_ms', 'p95'), ('template_ms', 'p95'), ('queries', 'p95'),
+    ('queries', 'max'),
+)
+
+
+class Command(BaseCommand):
+    help = 'Показывает статистику запросов по представлениям.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Вывести отчёт в формате JSON.',
+        )
+
+    def handle(self, *args, **options):
+        data = report(include_live=False)
+        if options['json']:
+            self.stdout.write(json.dumps(data, ensure_ascii=False, indent=2))
+            return
+        header = ['view', 'requests'] + [
+            f'{metric}.{stat}' for metric, stat in COLUMNS
+        ]
+        rows = [header] + [
+            [view_name, str(stats['requests'])] + [
+                str(stats[metric][stat]) for metric, stat in COLUMNS
+            ]
+            for view_name, stats in data.items()
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        for row in rows:
+            self.stdout.write('  '.join(
+                cell.ljust(width) for cell, width in zip(row, widths)
+            ))
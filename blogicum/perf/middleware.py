@@ -0,0 +1,76 @@
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .stats import registry
+
+UNRESOLVED = '<unresolved>'
+
+
+class QueryTimer:
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+@contextmanager
+def track_queries(request):
+    # Соединения с базой у каждого потока свои, поэтому view, которое
+    # выполняется в другом потоке (асинхронные view под ASGI), подключает
+    # счётчик запроса к своим соединениям само.
+    timer = getattr(request, '_perf_timer', None)
+    with ExitStack() as stack:
+        if timer is not None:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+        yield
+
+
+def add_template_time(request, seconds):
+    if hasattr(request, '_perf_template_seconds'):
+        request._perf_template_seconds += seconds
+
+
+class PerfMiddleware:
+
+    def __init__(self, get_response):
+        if not settings.PERF_MONITORING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        timer = request._perf_timer = QueryTimer()
+        request._perf_template_seconds = 0.0
+        with track_queries(request):
+            response = self.get_response(request)
+        match = request.resolver_match
+        registry.record(
+            match.view_name if match else UNRESOLVED,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            sql_ms=timer.seconds * 1000,
+            template_ms=request._perf_template_seconds * 1000,
+            queries=timer.count,
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        render_started = time.perf_counter()
+
+        def finish(rendered):
+            add_template_time(request, time.perf_counter() - render_started)
+
+        response.add_post_render_callback(finish)
+        return response
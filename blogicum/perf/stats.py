@@ -0,0 +1,212 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+TIME_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+logger = logging.getLogger(__name__)
+
+METRICS = {
+    'latency_ms': TIME_BUCKETS_MS,
+    'sql_ms': TIME_BUCKETS_MS,
+    'template_ms': TIME_BUCKETS_MS,
+    'queries': QUERY_BUCKETS,
+}
+
+
+class Histogram:
+
+    def __init__(self, bounds, counts=None, total=0.0, peak=0.0):
+        self.bounds = bounds
+        self.counts = counts or [0] * (len(bounds) + 1)
+        self.total = total
+        self.peak = peak
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.peak = max(self.peak, value)
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.peak = max(self.peak, other.peak)
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def percentile(self, fraction):
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index < len(self.bounds):
+                    return self.bounds[index]
+                return self.peak
+        return 0
+
+    def summary(self):
+        count = self.count
+        return {
+            'mean': round(self.total / count, 2) if count else 0,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'max': round(self.peak, 2),
+        }
+
+    def to_dict(self):
+        return {'counts': self.counts, 'total': self.total,
+                'peak': self.peak}
+
+    @classmethod
+    def from_dict(cls, bounds, data):
+        return cls(bounds, list(data['counts']), data['total'], data['peak'])
+
+
+class ViewStats:
+
+    def __init__(self):
+        self.histograms = {
+            metric: Histogram(bounds) for metric, bounds in METRICS.items()
+        }
+
+    def add(self, **values):
+        for metric, value in values.items():
+            self.histograms[metric].add(value)
+
+    def merge(self, other):
+        for metric, histogram in other.histograms.items():
+            self.histograms[metric].merge(histogram)
+
+    @property
+    def requests(self):
+        return self.histograms['latency_ms'].count
+
+    def summary(self):
+        result = {'requests': self.requests}
+        for metric, histogram in self.histograms.items():
+            result[metric] = histogram.summary()
+        return result
+
+    def to_dict(self):
+        return {metric: histogram.to_dict()
+                for metric, histogram in self.histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for metric, bounds in METRICS.items():
+            stats.histograms[metric] = Histogram.from_dict(
+                bounds, data[metric]
+            )
+        return stats
+
+
+class Registry:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+        self.last_flush = time.monotonic()
+
+    def record(self, view_name, **values):
+        with self.lock:
+            stats = self.views.get(view_name)
+            if stats is None:
+                stats = self.views[view_name] = ViewStats()
+            stats.add(**values)
+            now = time.monotonic()
+            # Сброс занимает поток, первым заметивший истёкший интервал;
+            # остальные потоки записывают снимок уже в следующий раз.
+            due = now - self.last_flush > settings.PERF_FLUSH_INTERVAL
+            if due:
+                self.last_flush = now
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                # Статистика не должна ломать запрос, который её собрал.
+                logger.exception('Не удалось сохранить статистику запросов')
+
+    def snapshot(self):
+        with self.lock:
+            return {name: stats.to_dict()
+                    for name, stats in self.views.items()}
+
+    def flush(self):
+        directory = settings.PERF_STATS_DIR
+        os.makedirs(directory, exist_ok=True)
+        pid = os.getpid()
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f'{pid}.', suffix='.tmp', dir=directory
+        )
+        try:
+            with open(descriptor, 'w', encoding='utf-8') as stream:
+                json.dump(self.snapshot(), stream)
+            os.replace(temporary, os.path.join(directory, f'{pid}.json'))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+registry = Registry()
+
+
+def load_stats(include_live=True):
+    merged = {}
+    directory = settings.PERF_STATS_DIR
+    own_file = f'{os.getpid()}.json'
+    names = os.listdir(directory) if os.path.isdir(directory) else []
+    snapshots = [
+        os.path.join(directory, name) for name in names
+        if name.endswith('.json')
+        and not (include_live and name == own_file)
+    ]
+    # Работающий воркер переписывает свой снимок при каждом сбросе, так
+    # что давно не менявшийся файл оставлен завершившимся процессом.
+    expired = time.time() - settings.PERF_STATS_MAX_AGE
+    views = []
+    for path in snapshots:
+        try:
+            if os.path.getmtime(path) < expired:
+                os.remove(path)
+                continue
+            with open(path, encoding='utf-8') as stream:
+                views.append(json.load(stream))
+        except (OSError, ValueError):
+            continue
+    if include_live:
+        views.append(registry.snapshot())
+    for snapshot in views:
+        for view_name, data in snapshot.items():
+            stats = ViewStats.from_dict(data)
+            if view_name in merged:
+                merged[view_name].merge(stats)
+            else:
+                merged[view_name] = stats
+    return merged
+
+
+def report(include_live=True):
+    return {
+        view_name: stats.summary()
+        for view_name, stats in sorted(load_stats(include_live).items())
+    }
+
+
+def flush_at_exit():
+    if registry.views:
+        registry.flush()
+
+
+atexit.register(flush_at_exit)
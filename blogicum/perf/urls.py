@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+app_name = 'perf'
+
+urlpatterns = [
+    path('', views.perf_report, name='report'),
+]
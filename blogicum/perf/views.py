@@ -0,0 +1,9 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from .stats import report
+
+
+@staff_member_required
+def perf_report(request):
+    return JsonResponse(report(), json_dumps_params={'ensure_ascii': False})
@@ -0,0 +1,101 @@
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.core.management.base import BaseCommand
+
+from tasks.queue import (
+    call_task, claim_next, mark_done, mark_failed, resolve, run_inline
+)
+
+
+class Command(BaseCommand):
+    help = 'Выполняет фоновые задачи из очереди.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=0,
+            help='Размер пула процессов для задач, нагружающих процессор.',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='Пауза в секундах, когда очередь пуста.',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Завершиться, когда в очереди не останется задач.',
+        )
+
+    def handle(self, *args, **options):
+        self.processed = 0
+        pool = None
+        if options['processes']:
+            # Процессы пула создаются при первой задаче, когда соединение с
+            # базой уже открыто. Запуск через spawn не наследует его, а
+            # django.setup() настраивает Django в каждом процессе заново.
+            pool = ProcessPoolExecutor(
+                max_workers=options['processes'],
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=django.setup,
+            )
+        try:
+            self.work(pool, options)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pool:
+                pool.shutdown()
+        self.stdout.write(
+            self.style.SUCCESS(f'Выполнено задач: {self.processed}')
+        )
+
+    def work(self, pool, options):
+        running = {}
+        while True:
+            task_obj = claim_next()
+            if task_obj is None:
+                if running:
+                    self.collect(running, wait_for_one=True)
+                    continue
+                if options['burst']:
+                    return
+                time.sleep(options['sleep'])
+                continue
+
+            try:
+                func = resolve(task_obj.name)
+            except (ImportError, AttributeError) as error:
+                mark_failed(task_obj, error)
+                continue
+
+            if pool and func.cpu_bound:
+                future = pool.submit(
+                    call_task, task_obj.name, task_obj.args, task_obj.kwargs
+                )
+                running[future] = task_obj
+                if len(running) >= options['processes']:
+                    self.collect(running, wait_for_one=True)
+            else:
+                run_inline(task_obj)
+                self.processed += 1
+            self.collect(running)
+
+    def collect(self, running, wait_for_one=False):
+        if wait_for_one:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+        else:
+            done = [future for future in running if future.done()]
+        for future in done:
+            task_obj = running.pop(future)
+            error = future.exception()
+            if error is None:
+                mark_done(task_obj)
+            else:
+                mark_failed(task_obj, error)
+            self.processed += 1
@@ -0,0 +1,82 @@
+from django.db import models
+from django.utils import timezone
+
+MAX_NAME_LENGTH = 256
+MAX_ATTEMPTS = 5
+
+
+class Task(models.Model):
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'В очереди'
+        RUNNING = 'running', 'Выполняется'
+        DONE = 'done', 'Выполнена'
+        FAILED = 'failed', 'Ошибка'
+
+    name = models.CharField(
+        max_length=MAX_NAME_LENGTH,
+        verbose_name='Функция'
+    )
+
+    args = models.JSONField(default=list, verbose_name='Аргументы')
+
+    kwargs = models.JSONField(
+        default=dict,
+        verbose_name='Именованные аргументы'
+    )
+
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        verbose_name='Статус'
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Попыток'
+    )
+
+    max_attempts = models.PositiveSmallIntegerField(
+        default=MAX_ATTEMPTS,
+        verbose_name='Максимум попыток'
+    )
+
+    run_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Запустить не раньше'
+    )
+
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Начата'
+    )
+
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Завершена'
+    )
+
+    last_error = models.TextField(blank=True, verbose_name='Последняя ошибка')
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Добавлено'
+    )
+
+    class Meta:
+        verbose_name = 'задача'
+        verbose_name_plural = 'Задачи'
+        ordering = ('run_at', 'id')
+        indexes = [
+            models.Index(
+                fields=['run_at'],
+                name='task_queued_run_at_idx',
+                condition=models.Q(status='queued')
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.name} ({self.get_status_display()})'
@@ -0,0 +1,102 @@
+import importlib
+import traceback
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+
+
+def task(func=None, *, cpu_bound=False, max_attempts=None):
+    if func is None:
+        return lambda func: task(
+            func, cpu_bound=cpu_bound, max_attempts=max_attempts
+        )
+
+    name = f'{func.__module__}.{func.__name__}'
+
+    @wraps(func)
+    def delay(*args, **kwargs):
+        if settings.TASKS_EAGER:
+            return func(*args, **kwargs)
+        fields = {'name': name, 'args': list(args), 'kwargs': kwargs}
+        if max_attempts is not None:
+            fields['max_attempts'] = max_attempts
+        return Task.objects.create(**fields)
+
+    func.delay = delay
+    func.cpu_bound = cpu_bound
+    func.task_name = name
+    return func
+
+
+def resolve(name):
+    module_name, func_name = name.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def call_task(name, args, kwargs):
+    return resolve(name)(*args, **kwargs)
+
+
+def claim_next():
+    now = timezone.now()
+    stale = Q(
+        status=Task.Status.RUNNING,
+        started_at__lt=now - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT),
+    )
+    # Задача, на которой воркер падает целиком, не должна перезапускаться
+    # бесконечно: исчерпавшие попытки зависшие задачи считаются упавшими.
+    Task.objects.filter(stale, attempts__gte=F('max_attempts')).update(
+        status=Task.Status.FAILED,
+        finished_at=now,
+        last_error='Воркер не завершил задачу за отведённое время.',
+    )
+    ready = Task.objects.filter(
+        Q(status=Task.Status.QUEUED, run_at__lte=now)
+        | stale & Q(attempts__lt=F('max_attempts'))
+    )
+    for pk in ready.order_by('run_at', 'pk').values_list('pk', flat=True)[:5]:
+        claimed = ready.filter(pk=pk).update(
+            status=Task.Status.RUNNING,
+            attempts=F('attempts') + 1,
+            started_at=now,
+        )
+        if claimed:
+            return Task.objects.get(pk=pk)
+
+
+def mark_done(task_obj):
+    task_obj.status = Task.Status.DONE
+    task_obj.finished_at = timezone.now()
+    task_obj.save(update_fields=['status', 'finished_at'])
+
+
+def mark_failed(task_obj, error):
+    task_obj.last_error = ''.join(
+        traceback.format_exception(type(error), error, error.__traceback__)
+    )
+    if task_obj.attempts < task_obj.max_attempts:
+        task_obj.status = Task.Status.QUEUED
+        task_obj.run_at = timezone.now() + timedelta(
+            seconds=settings.TASKS_RETRY_BACKOFF
+            * 2 ** (task_obj.attempts - 1)
+        )
+    else:
+        task_obj.status = Task.Status.FAILED
+        task_obj.finished_at = timezone.now()
+    task_obj.save(
+        update_fields=['status', 'run_at', 'finished_at', 'last_error']
+    )
+
+
+def run_inline(task_obj):
+    try:
+        call_task(task_obj.name, task_obj.args, task_obj.kwargs)
+    except Exception as error:
+        mark_failed(task_obj, error)
+    else:
+        mark_done(task_obj)
@@ -1,6 +1,7 @@
 import os
 import re
 import time
+from copy import deepcopy
 from http import HTTPStatus
 from inspect import getsource
 from pathlib import Path
@@ -35,6 +36,20 @@ UrlRepr = NamedTuple("UrlRepr", [("url", str), ("repr", str)])
 TitledUrlRepr = TypeVar("TitledUrlRepr", bound=Tuple[UrlRepr, str])
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_shared_cache(tmp_path_factory):
+    # Метки версий и сессии не должны переходить из одного запуска тестов
+    # в другой через общий файловый кэш.
+    from django.conf import settings
+
+    caches = deepcopy(settings.CACHES)
+    shared = caches[settings.SHARED_CACHE_ALIAS]
+    if shared["BACKEND"].endswith("FileBasedCache"):
+        shared["LOCATION"] = str(tmp_path_factory.mktemp("shared_cache"))
+    with override_settings(CACHES=caches):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def enable_debug_false():
     with override_settings(DEBUG=False):
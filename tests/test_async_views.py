@@ -0,0 +1,47 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import AsyncRequestFactory
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+
+def test_async_feed_view(mixer: Mixer, user, published_category):
+    from blog.async_views import as_async_view
+    from blog.views import PostListView
+
+    post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, pub_date=timezone.now() - timedelta(days=1),
+    )
+    view = as_async_view(PostListView)
+    assert asyncio.iscoroutinefunction(view), (
+        "Убедитесь, что асинхронная версия ленты является корутиной."
+    )
+    request = AsyncRequestFactory().get("/")
+    request.user = user
+    request.session = SessionStore()
+
+    response = async_to_sync(view)(request)
+
+    assert response.status_code == 200
+    assert post.title in response.content.decode("utf-8")
+
+
+def test_async_view_propagates_404(user):
+    from django.http import Http404
+
+    from blog.async_views import as_async_view
+    from blog.views import PostCategoryListView
+
+    request = AsyncRequestFactory().get("/category/missing/")
+    request.user = user
+    with pytest.raises(Http404):
+        async_to_sync(as_async_view(PostCategoryListView))(
+            request, slug="missing"
+        )
@@ -0,0 +1,91 @@
+import pytest
+from django.test import Client
+
+pytestmark = [pytest.mark.django_db]
+
+
+def clone(client):
+    copy = Client()
+    copy.cookies = client.cookies.__class__(client.cookies)
+    return copy
+
+
+def test_profile_edit_refreshes_cached_user(
+        user_client, user, django_assert_num_queries
+):
+    user_client.get("/")
+    with django_assert_num_queries(0):
+        user_client.get("/pages/about/")
+
+    response = user_client.post("/edit/", data={
+        "first_name": "Новое имя",
+        "last_name": user.last_name,
+        "username": user.username,
+        "email": user.email,
+    })
+    assert response.status_code == 302
+    response = user_client.get("/pages/about/")
+    assert response.wsgi_request.user.first_name == "Новое имя", (
+        "Убедитесь, что после редактирования профиля пользователь не берётся"
+        " из устаревшего кэша."
+    )
+
+
+def test_password_change_ends_other_sessions(user):
+    user.set_password("old-Secret-42")
+    user.save()
+    devices = [Client(), Client()]
+    for device in devices:
+        device.login(username=user.username, password="old-Secret-42")
+        assert device.get("/").wsgi_request.user.is_authenticated
+
+    response = devices[0].post("/auth/password_change/", data={
+        "old_password": "old-Secret-42",
+        "new_password1": "new-Secret-42",
+        "new_password2": "new-Secret-42",
+    })
+    assert response.status_code == 302
+    assert devices[0].get("/").wsgi_request.user.is_authenticated
+    assert not devices[1].get("/").wsgi_request.user.is_authenticated, (
+        "Убедитесь, что смена пароля завершает остальные сессии"
+        " пользователя, даже если они закэшированы."
+    )
+
+
+def test_logout_drops_cached_session(user_client):
+    stolen = clone(user_client)
+    assert stolen.get("/").wsgi_request.user.is_authenticated
+
+    user_client.get("/auth/logout/")
+    assert not stolen.get("/").wsgi_request.user.is_authenticated, (
+        "Убедитесь, что после выхода сессия не остаётся в кэше."
+    )
+
+
+def test_auth_cache_is_shared_between_processes(settings):
+    if settings.SESSION_ENGINE.endswith("cached_db") or any(
+        backend.endswith("CachedModelBackend")
+        for backend in settings.AUTHENTICATION_BACKENDS
+    ):
+        backend = settings.CACHES[settings.SESSION_CACHE_ALIAS]["BACKEND"]
+        assert not backend.endswith("LocMemCache"), (
+            "Убедитесь, что сессии и пользователи кэшируются только в общем"
+            " для всех процессов кэше: иначе выход из аккаунта и смена"
+            " пароля не видны другим воркерам."
+        )
+
+
+def test_user_snapshot_is_slim(user_client, user, django_assert_num_queries):
+    from blog.auth import user_cache, user_cache_key
+
+    user_client.get("/")
+    values, session_hash = user_cache().get(user_cache_key(user.pk))
+    assert "password" not in values and "is_superuser" not in values, (
+        "Убедитесь, что в кэш пользователя не попадают хеш пароля и права"
+        " суперпользователя."
+    )
+    assert session_hash == user.get_session_auth_hash()
+    with django_assert_num_queries(0):
+        assert user_client.get(
+            "/pages/about/"
+        ).wsgi_request.user.is_authenticated
@@ -0,0 +1,49 @@
+import pytest
+from django.core.management import call_command
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_views(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    for text in ("first", "second"):
+        user_client.post(f"/posts/{post.id}/comment/", data={"text": text})
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что счётчик комментариев публикации увеличивается"
+        " при добавлении комментария."
+    )
+
+    comment = post.comments.first()
+    user_client.post(f"/posts/{post.id}/delete_comment/{comment.id}/")
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что счётчик комментариев публикации уменьшается"
+        " при удалении комментария."
+    )
+
+
+def test_stale_post_save_keeps_comment_count(
+        mixer: Mixer, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    post.title = "Новый заголовок"
+    post.save()
+    post.refresh_from_db()
+    assert post.comment_count == 3
+    assert post.title == "Новый заголовок"
+
+
+def test_recount_comments_repairs_drift(
+        mixer: Mixer, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    type(post).objects.filter(pk=post.pk).update(comment_count=42)
+    call_command("recount_comments")
+    post.refresh_from_db()
+    assert post.comment_count == 2
@@ -0,0 +1,56 @@
+import pytest
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def many_comments(mixer: Mixer, user, post_with_published_location):
+    return mixer.cycle(25).blend(
+        "blog.Comment", author=user, post=post_with_published_location
+    )
+
+
+def test_detail_renders_first_comment_page(
+        user_client, post_with_published_location, many_comments
+):
+    from blog.views import COMMENTS_PER_PAGE
+
+    response = user_client.get(f"/posts/{post_with_published_location.id}/")
+    comments = response.context["comments"]
+    assert list(comments) == many_comments[:COMMENTS_PER_PAGE], (
+        "Убедитесь, что на странице публикации выводится только первая"
+        " страница комментариев в порядке их создания."
+    )
+    assert "Показать ещё комментарии" in response.content.decode("utf-8")
+
+    response = user_client.get(
+        f"/posts/{post_with_published_location.id}/comments/",
+        {"after": comments.next_cursor},
+    )
+    assert response.status_code == 200
+    assert list(response.context["comments"]) == (
+        many_comments[COMMENTS_PER_PAGE:]
+    ), (
+        "Убедитесь, что фрагмент с комментариями продолжает список с места,"
+        " на котором закончилась предыдущая страница."
+    )
+    assert "Показать ещё комментарии" not in response.content.decode("utf-8")
+    assert "<html" not in response.content.decode("utf-8")
+
+
+def test_comment_fragment_hides_unpublished_post(
+        another_user_client, mixer: Mixer, user, published_category
+):
+    unpublished_post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=False,
+    )
+    mixer.blend("blog.Comment", post=unpublished_post)
+    response = another_user_client.get(
+        f"/posts/{unpublished_post.id}/comments/"
+    )
+    assert response.status_code == 404, (
+        "Убедитесь, что комментарии к скрытой публикации недоступны"
+        " другим пользователям."
+    )
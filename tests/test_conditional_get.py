@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_post_detail_is_not_rendered_when_unchanged(
+        user_client, another_user_client, user, post_with_published_location,
+        django_assert_num_queries, mixer: Mixer
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    response = user_client.get(url)
+    etag = response["ETag"]
+    assert response.has_header("Last-Modified"), (
+        "Убедитесь, что страница публикации возвращает Last-Modified."
+    )
+
+    # публикация
+    with django_assert_num_queries(1):
+        response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что неизменённая страница публикации возвращает 304"
+        " без загрузки комментариев и отрисовки шаблона."
+    )
+
+    response = another_user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что ETag страницы публикации зависит от посетителя."
+    )
+
+    mixer.blend("blog.Comment", author=user, post=post_with_published_location)
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что новый комментарий изменяет ETag страницы публикации."
+    )
+
+
+def test_comment_changes_update_post(
+        mixer: Mixer, user, post_with_published_location
+):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", author=user, post=post)
+    for change in (comment.save, comment.delete):
+        post.refresh_from_db()
+        updated_at = post.updated_at
+        change()
+        post.refresh_from_db()
+        assert post.updated_at > updated_at, (
+            "Убедитесь, что изменение комментария обновляет дату изменения"
+            " публикации."
+        )
+
+
+@pytest.mark.parametrize("page_cache", [True, False])
+def test_feed_answers_conditional_requests(
+        client, mixer: Mixer, user, published_category, page_cache
+):
+    post = mixer.blend("blog.Post", author=user, category=published_category,
+                       pub_date=timezone.now() - timedelta(days=1))
+    with override_settings(PAGE_CACHE_ENABLED=page_cache):
+        response = client.get("/")
+        etag = response["ETag"]
+        assert not response.has_header("Last-Modified"), (
+            "Убедитесь, что лента проверяется только по ETag: удаление"
+            " публикации не меняет ни одну из дат ленты."
+        )
+        assert client.get(
+            "/", HTTP_IF_NONE_MATCH=etag
+        ).status_code == HTTPStatus.NOT_MODIFIED
+
+        post.delete()
+        response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            "Убедитесь, что удаление публикации изменяет ETag ленты."
+        )
+        response = client.get(
+            "/", HTTP_IF_MODIFIED_SINCE=http_date(time.time())
+        )
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что лента не отвечает 304 только по If-Modified-Since."
+    )
@@ -0,0 +1,16 @@
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_repository_fixture_loads():
+    from blog.models import Post
+
+    call_command("loaddata", str(settings.BASE_DIR / "db.json"), verbosity=0)
+    assert Post.objects.exists()
+    assert not Post.objects.filter(updated_at__isnull=True).exists(), (
+        "Убедитесь, что фикстуры без поля updated_at загружаются, а дата"
+        " изменения публикации заполняется значением по умолчанию."
+    )
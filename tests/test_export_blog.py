@@ -0,0 +1,73 @@
+import gzip
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_export_is_loaddata_compatible(
+        tmp_path, mixer: Mixer, user, published_category, PostModel
+):
+    posts = mixer.cycle(3).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    mixer.blend("blog.Comment", post=posts[0], author=user)
+    path = tmp_path / "blog.jsonl.gz"
+
+    call_command("export_blog", output=str(path), stdout=StringIO())
+
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        models = [json.loads(line)["model"] for line in stream]
+    assert models.count("blog.post") == 3
+    assert models.count("blog.comment") == 1
+    assert models.count("auth.user") == 1
+
+    PostModel.objects.all().delete()
+    call_command("loaddata", str(path), verbosity=0)
+    assert PostModel.objects.count() == 3, (
+        "Убедитесь, что выгрузку export_blog можно загрузить обратно"
+        " командой loaddata."
+    )
+
+
+def test_export_since(tmp_path, mixer: Mixer, user, published_category):
+    old, new = mixer.cycle(2).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    type(old).objects.filter(pk=old.pk).update(
+        created_at=timezone.now() - timedelta(days=10)
+    )
+    path = tmp_path / "posts.jsonl"
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+
+    call_command(
+        "export_blog", output=str(path), models=["posts"], since=since,
+        stdout=StringIO(),
+    )
+
+    exported = [json.loads(line)["pk"] for line in path.open()]
+    assert exported == [new.pk], (
+        "Убедитесь, что с параметром --since выгружаются только новые"
+        " записи."
+    )
+
+
+def test_export_to_stdout_is_jsonl(mixer: Mixer, user, published_category):
+    mixer.cycle(2).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    stdout = StringIO()
+
+    call_command("export_blog", models=["posts"], stdout=stdout)
+
+    lines = stdout.getvalue().splitlines()
+    assert len(lines) == 2, (
+        "Убедитесь, что без --output каждая запись выводится одной строкой."
+    )
+    assert [json.loads(line)["model"] for line in lines] == ["blog.post"] * 2
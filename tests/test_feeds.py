@@ -0,0 +1,96 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_posts(mixer: Mixer, user, published_category, another_category):
+    now = timezone.now()
+
+    def blend(**kwargs):
+        defaults = dict(
+            author=user, category=published_category, is_published=True,
+            pub_date=now - timedelta(days=1),
+        )
+        return mixer.blend("blog.Post", **{**defaults, **kwargs})
+
+    hidden_category = mixer.blend("blog.Category", is_published=False)
+    return {
+        "visible": blend(),
+        "other_category": blend(category=another_category),
+        "unpublished": blend(is_published=False),
+        "scheduled": blend(pub_date=now + timedelta(days=1)),
+        "hidden_category": blend(category=hidden_category),
+    }
+
+
+@pytest.mark.parametrize("kind", ["rss", "atom"])
+def test_feeds_show_only_published_posts(
+        client, feed_posts, user, published_category, kind
+):
+    urls = {
+        "global": f"/feeds/{kind}/",
+        "category": f"/category/{published_category.slug}/{kind}/",
+        "author": f"/profile/{user.username}/{kind}/",
+    }
+    for scope, url in urls.items():
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, url
+        content = response.content.decode("utf-8")
+        assert feed_posts["visible"].title in content, (
+            f"Убедитесь, что в ленте `{url}` есть опубликованные посты."
+        )
+        hidden = ["unpublished", "scheduled", "hidden_category"]
+        if scope == "category":
+            hidden.append("other_category")
+        for key in hidden:
+            assert feed_posts[key].title not in content, (
+                f"Убедитесь, что лента `{url}` скрывает те же публикации,"
+                " что и лента на главной странице."
+            )
+
+
+def test_hidden_category_feed_is_not_found(client, mixer: Mixer):
+    category = mixer.blend("blog.Category", is_published=False)
+    response = client.get(f"/category/{category.slug}/rss/")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_feed_is_cached_until_post_changes(
+        client, feed_posts, django_assert_num_queries
+):
+    response = client.get("/feeds/atom/")
+    etag = response["ETag"]
+    with django_assert_num_queries(0):
+        assert client.get("/feeds/atom/").content == response.content
+        response = client.get("/feeds/atom/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что лента поддерживает условные запросы."
+    )
+
+    post = feed_posts["visible"]
+    post.title = "Новый заголовок публикации"
+    post.save()
+    response = client.get("/feeds/atom/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert post.title in response.content.decode("utf-8"), (
+        "Убедитесь, что лента перестраивается при изменении публикации."
+    )
+
+
+def test_feed_cache_expires_at_next_publication(
+        feed_posts, published_category, another_category
+):
+    from blog.feeds import CategoryPostsFeed
+
+    timeout = CategoryPostsFeed().get_cache_timeout(published_category)
+    assert 0 < timeout <= 60 * 60 * 24, (
+        "Убедитесь, что лента хранится в кэше не дольше, чем до"
+        " публикации ближайшего отложенного поста."
+    )
+    assert timeout < CategoryPostsFeed().get_cache_timeout(another_category)
@@ -0,0 +1,108 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    return settings.MEDIA_ROOT
+
+
+def post_record(title, **extra):
+    return {
+        "title": title,
+        "text": "Текст",
+        "pub_date": "2020-01-01T10:00:00",
+        "author": "old_author",
+        "category": "imported",
+        **extra,
+    }
+
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as stream:
+        for record in records:
+            line = record if isinstance(record, str) else json.dumps(record)
+            stream.write(line + "\n")
+    return path
+
+
+def run_import(path, **options):
+    stderr = StringIO()
+    call_command(
+        "import_posts", str(path), processes=0, stdout=StringIO(),
+        stderr=stderr, **options
+    )
+    return stderr.getvalue()
+
+
+def test_import_posts_with_comments_and_images(tmp_path, PostModel):
+    Image.new("RGB", (800, 600)).save(tmp_path / "photo.jpg", "JPEG")
+    (tmp_path / "broken.jpg").write_bytes(b"not an image")
+    path = write_jsonl(tmp_path / "posts.jsonl", [
+        post_record("С фото", image="photo.jpg", comments=[
+            {"author": "reader", "text": "Первый",
+             "created_at": "2020-01-02T10:00:00"},
+            {"author": "old_author", "text": "Второй"},
+        ]),
+        post_record("Сломанное фото", image="broken.jpg"),
+        "{не json",
+        post_record("Без фото", location="Город"),
+    ])
+
+    errors = run_import(path, batch_size=2)
+
+    assert PostModel.objects.count() == 3, (
+        "Убедитесь, что команда import_posts создаёт публикации из всех"
+        " корректных строк файла."
+    )
+    post = PostModel.objects.get(title="С фото")
+    assert post.image.name.startswith("posts_images/")
+    assert post.image_variants["sizes"], (
+        "Убедитесь, что при импорте создаются уменьшенные копии фото."
+    )
+    assert post.comment_count == 2
+    assert post.comments.get(text="Первый").created_at.year == 2020, (
+        "Убедитесь, что при импорте сохраняется дата комментария."
+    )
+    assert not PostModel.objects.get(title="Сломанное фото").image
+    assert "broken.jpg" in errors and "Строка 3" in errors
+    assert not (tmp_path / "posts.jsonl.checkpoint").exists()
+
+
+def test_import_posts_resumes_from_checkpoint(tmp_path, PostModel):
+    first_line = json.dumps(post_record("Первая")) + "\n"
+    path = write_jsonl(tmp_path / "posts.jsonl", [first_line.strip()])
+    run_import(path)
+    write_jsonl(path, [first_line.strip(), post_record("Вторая")])
+    checkpoint = tmp_path / "posts.jsonl.checkpoint"
+    checkpoint.write_text(json.dumps({
+        "batch_offset": 0, "batch_line": 0,
+        "offset": len(first_line.encode()), "line": 1,
+        "last_pk": PostModel.objects.get().pk,
+    }))
+
+    run_import(path)
+
+    assert sorted(PostModel.objects.values_list("title", flat=True)) == [
+        "Вторая", "Первая"
+    ], (
+        "Убедитесь, что после сбоя импорт продолжается с контрольной точки"
+        " и не дублирует уже загруженные публикации."
+    )
+
+
+def test_import_refreshes_cached_feed(tmp_path, client):
+    assert "Из импорта" not in client.get("/feeds/rss/").content.decode()
+    run_import(write_jsonl(tmp_path / "posts.jsonl", [
+        post_record("Из импорта"),
+    ]))
+    assert "Из импорта" in client.get("/feeds/rss/").content.decode(), (
+        "Убедитесь, что после импорта закэшированные ленты обновляются."
+    )
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_anonymous_index_is_served_from_cache(
+        client, user_client, mixer: Mixer, user, published_category,
+        django_assert_num_queries
+):
+    mixer.blend("blog.Post", author=user, category=published_category,
+                pub_date=timezone.now() - timedelta(days=1))
+    client.get("/")
+    with django_assert_num_queries(0):
+        client.get("/")
+        client.get("/pages/about/")
+        client.get("/pages/about/")
+
+    response = user_client.get("/")
+    assert response.context is not None, (
+        "Убедитесь, что авторизованные пользователи не получают страницы"
+        " из кэша анонимных посетителей."
+    )
+
+    post = mixer.blend("blog.Post", author=user, category=published_category,
+                       pub_date=timezone.now() - timedelta(hours=1))
+    content = client.get("/").content.decode("utf-8")
+    assert post.title in content, (
+        "Убедитесь, что кэш страниц сбрасывается при изменении публикаций."
+    )
+
+
+def test_page_cache_expires_at_next_publication(
+        mixer: Mixer, user, published_category
+):
+    from blog.views import PostListView
+
+    mixer.blend("blog.Post", author=user, category=published_category,
+                is_published=True,
+                pub_date=timezone.now() + timedelta(seconds=90))
+    timeout = PostListView().get_page_cache_timeout()
+    assert 0 < timeout <= 90, (
+        "Убедитесь, что страница ленты хранится в кэше не дольше, чем до"
+        " публикации ближайшего отложенного поста."
+    )
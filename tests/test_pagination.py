@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_posts(mixer: Mixer, user, published_category):
+    now = timezone.now()
+    same_date = now - timedelta(days=1)
+    dates = (
+        same_date if i % 3 == 0 else now - timedelta(hours=i + 30)
+        for i in range(N_PER_PAGE * 2 + 5)
+    )
+    return mixer.cycle(N_PER_PAGE * 2 + 5).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=dates,
+    )
+
+
+def collect_pages(client, url, direction, token=None):
+    pages = []
+    while True:
+        query = f"?{direction}={token}" if token else ""
+        page_obj = client.get(url + query).context["page_obj"]
+        pages.append([post.id for post in page_obj])
+        if direction == "after" and page_obj.has_next():
+            token = page_obj.next_cursor
+        elif direction == "before" and page_obj.has_previous():
+            token = page_obj.previous_cursor
+        else:
+            return pages, page_obj
+
+
+@override_settings(POSTS_PAGINATION_MODE="keyset")
+@pytest.mark.parametrize("url_name", ["index", "category", "profile"])
+def test_keyset_pagination_walks_whole_feed(
+        user_client, feed_posts, published_category, user, url_name
+):
+    url = {
+        "index": "/",
+        "category": f"/category/{published_category.slug}/",
+        "profile": f"/profile/{user.username}/",
+    }[url_name]
+    expected = [
+        post.id for post in sorted(
+            feed_posts, key=lambda p: (p.pub_date, p.id), reverse=True
+        )
+    ]
+
+    pages, last_page = collect_pages(user_client, url, "after")
+    assert [len(page) for page in pages] == [N_PER_PAGE, N_PER_PAGE, 5], (
+        "Убедитесь, что в курсорном режиме страницы ленты содержат"
+        f" по {N_PER_PAGE} публикаций."
+    )
+    assert sum(pages, []) == expected, (
+        "Убедитесь, что курсорная пагинация обходит ленту без пропусков"
+        " и повторов в порядке убывания даты публикации."
+    )
+
+    back_pages, first_page = collect_pages(
+        user_client, url, "before", last_page.previous_cursor
+    )
+    assert sum(reversed(back_pages), []) == expected[:N_PER_PAGE * 2], (
+        "Убедитесь, что ссылка на предыдущую страницу в курсорном режиме"
+        " возвращает публикации в том же порядке."
+    )
+    assert not first_page.has_previous()
+
+
+@override_settings(POSTS_PAGINATION_MODE="keyset")
+def test_keyset_pagination_renders_cursor_links(user_client, feed_posts):
+    content = user_client.get("/").content.decode("utf-8")
+    assert "?after=" in content, (
+        "Убедитесь, что в курсорном режиме шаблон пагинации выводит ссылку"
+        " на следующую страницу с параметром `after`."
+    )
+    assert "?page=" not in content
+
+
+def test_keyset_pagination_bad_cursor(user_client, feed_posts):
+    with override_settings(POSTS_PAGINATION_MODE="keyset"):
+        response = user_client.get("/?after=not-a-cursor")
+    assert response.status_code == 404
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def long_feed(mixer: Mixer, user, published_category):
+    return mixer.cycle(120).blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, pub_date=timezone.now() - timedelta(days=1),
+    )
+
+
+def test_paginator_renders_bounded_window(client, long_feed):
+    content = client.get("/?page=6").content.decode("utf-8")
+    links = content.count('class="page-link"')
+    assert "?page=12" in content and "…" in content
+    assert "?page=3" not in content and "?page=9" not in content
+    assert links <= 13, (
+        "Убедитесь, что пагинатор выводит ограниченное окно ссылок на"
+        " страницы, а не все страницы ленты."
+    )
+
+
+def test_feed_count_is_cached(
+        user_client, long_feed, django_assert_num_queries, mixer: Mixer,
+        user, published_category
+):
+    user_client.get("/")
+    # две даты для ETag и страница ленты без COUNT(*)
+    with django_assert_num_queries(3):
+        response = user_client.get("/?page=2")
+    assert response.context["paginator"].count == 120
+
+    mixer.blend("blog.Post", author=user, category=published_category,
+                is_published=True,
+                pub_date=timezone.now() - timedelta(days=1))
+    response = user_client.get("/")
+    assert response.context["paginator"].count == 121, (
+        "Убедитесь, что кэш числа публикаций сбрасывается при их изменении."
+    )
@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import AsyncClient, Client, override_settings
+from django.urls import include, path
+
+from perf.stats import load_stats, registry
+
+pytestmark = [pytest.mark.django_db]
+
+
+def async_category_urls():
+    from blog.async_views import as_async_view
+    from blog.views import PostCategoryListView
+
+    return [
+        path("category/<slug:slug>/", as_async_view(PostCategoryListView),
+             name="async_category"),
+        path("", include("blogicum.urls")),
+    ]
+
+
+urlpatterns = async_category_urls()
+
+
+@pytest.fixture
+def perf_client(settings, tmp_path, user):
+    settings.PERF_MONITORING = True
+    settings.PERF_STATS_DIR = tmp_path
+    registry.views.clear()
+    client = Client()
+    client.force_login(user)
+    yield client
+    registry.views.clear()
+
+
+def test_middleware_records_view_stats(
+        perf_client, many_posts_with_published_locations
+):
+    for _ in range(3):
+        perf_client.get("/")
+    stats = registry.views["blog:index"].summary()
+    assert stats["requests"] == 3
+    assert stats["queries"]["max"] >= 2, (
+        "Убедитесь, что промежуточный слой считает SQL-запросы страницы."
+    )
+    assert stats["template_ms"]["max"] > 0
+    assert stats["latency_ms"]["max"] >= stats["sql_ms"]["max"]
+
+
+def test_report_endpoint_is_staff_only(perf_client, user):
+    perf_client.get("/")
+    assert perf_client.get("/perf/").status_code == 302
+
+    user.is_staff = True
+    user.save()
+    response = perf_client.get("/perf/")
+    assert response.status_code == 200
+    assert "blog:index" in response.json()
+
+
+def test_perfreport_reads_flushed_stats(perf_client):
+    perf_client.get("/")
+    registry.flush()
+    out = StringIO()
+    call_command("perfreport", "--json", stdout=out)
+    assert json.loads(out.getvalue())["blog:index"]["requests"] == 1
+
+
+def test_stale_snapshots_are_pruned(perf_client, settings):
+    perf_client.get("/")
+    registry.flush()
+    snapshot = next(settings.PERF_STATS_DIR.iterdir())
+    dead = settings.PERF_STATS_DIR / "1.json"
+    dead.write_text(snapshot.read_text())
+    expired = time.time() - settings.PERF_STATS_MAX_AGE - 60
+    os.utime(dead, (expired, expired))
+
+    stats = load_stats(include_live=False)
+    assert stats["blog:index"].requests == 1, (
+        "Убедитесь, что в отчёт не попадают давно не обновлявшиеся снимки"
+        " завершившихся воркеров."
+    )
+    assert not dead.exists()
+
+
+def test_concurrent_flushes_do_not_fail_requests(perf_client, settings):
+    settings.PERF_FLUSH_INTERVAL = 0
+    errors = []
+
+    def record():
+        for _ in range(100):
+            try:
+                registry.record("blog:index", latency_ms=1, sql_ms=0,
+                                template_ms=0, queries=0)
+            except Exception as error:
+                errors.append(error)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, (
+        "Убедитесь, что одновременный сброс статистики из нескольких"
+        " потоков не приводит к ошибкам в запросах."
+    )
+    assert registry.views["blog:index"].requests == 800
+    assert [path.suffix for path in settings.PERF_STATS_DIR.iterdir()] == [
+        ".json"
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_views_are_measured(
+        settings, tmp_path, mixer, user, published_category
+):
+    settings.PERF_MONITORING = True
+    settings.PERF_STATS_DIR = tmp_path
+    registry.views.clear()
+    mixer.blend("blog.Post", author=user, category=published_category)
+
+    async def get(url):
+        return await AsyncClient().get(url)
+
+    with override_settings(ROOT_URLCONF=__name__):
+        response = async_to_sync(get)(f"/category/{published_category.slug}/")
+    assert response.status_code == 200
+    stats = registry.views.pop("async_category").summary()
+    assert stats["queries"]["max"] >= 2, (
+        "Убедитесь, что под ASGI учитываются SQL-запросы view, выполненного"
+        " в пуле потоков."
+    )
+    assert stats["template_ms"]["max"] > 0
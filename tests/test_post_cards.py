@@ -0,0 +1,91 @@
+import pytest
+from django.utils import timezone
+from django.test.signals import template_rendered
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def card_renders():
+    rendered = []
+
+    def on_render(sender, template, context, **kwargs):
+        if template.name == "includes/post_card.html":
+            rendered.append(context["post"].pk)
+
+    template_rendered.connect(on_render)
+    yield rendered
+    template_rendered.disconnect(on_render)
+
+
+def test_post_cards_are_cached_and_invalidated(
+        user_client, many_posts_with_published_locations, card_renders
+):
+    user_client.get("/")
+    assert len(card_renders) == 10
+    card_renders.clear()
+
+    user_client.get("/")
+    assert card_renders == [], (
+        "Убедитесь, что при повторном запросе карточки публикаций берутся"
+        " из кэша, а не рендерятся заново."
+    )
+
+    post = user_client.get("/").context["page_obj"][0]
+    post.title = "Обновлённый заголовок"
+    post.save()
+    content = user_client.get("/").content.decode("utf-8")
+    assert card_renders == [post.pk]
+    assert "Обновлённый заголовок" in content
+    card_renders.clear()
+
+    post.category.title = "Обновлённая категория"
+    post.category.save()
+    content = user_client.get("/").content.decode("utf-8")
+    assert len(card_renders) == 10
+    assert "Обновлённая категория" in content
+
+
+def test_only_displayed_user_changes_invalidate_cards(
+        user_client, many_posts_with_published_locations, card_renders,
+        mixer
+):
+    user_client.get("/")
+    card_renders.clear()
+
+    author = many_posts_with_published_locations[0].author
+    author.set_password("another-Secret-42")
+    author.email = "new@example.com"
+    author.save()
+    mixer.blend("auth.User")
+    user_client.get("/")
+    assert card_renders == [], (
+        "Убедитесь, что регистрация и смена пароля или почты не сбрасывают"
+        " кэш карточек публикаций."
+    )
+
+    author.username = "renamed_author"
+    author.save()
+    content = user_client.get("/").content.decode("utf-8")
+    assert len(card_renders) == 10
+    assert "@renamed_author" in content
+
+
+def test_cards_follow_changes_made_without_signals(
+        user_client, many_posts_with_published_locations, card_renders
+):
+    # Так выглядит правка из другого процесса, например из runworker:
+    # сигналы этого процесса о ней не знают.
+    from blog.models import Post
+
+    post = user_client.get("/").context["page_obj"][0]
+    card_renders.clear()
+    Post.objects.filter(pk=post.pk).update(
+        title="Заголовок из другого процесса", updated_at=timezone.now()
+    )
+    content = user_client.get("/").content.decode("utf-8")
+    assert card_renders == [post.pk], (
+        "Убедитесь, что карточка перерисовывается после изменения даты"
+        " изменения публикации, даже если сигналы не сработали."
+    )
+    assert "Заголовок из другого процесса" in content
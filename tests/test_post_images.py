@@ -0,0 +1,77 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def make_upload(size=(1600, 900)):
+    buffer = BytesIO()
+    Image.new("RGB", size, color=(73, 109, 137)).save(buffer, "JPEG")
+    return SimpleUploadedFile(
+        "photo.jpg", buffer.getvalue(), content_type="image/jpeg"
+    )
+
+
+def test_upload_creates_thumbnails(
+        user_client, user, published_category, published_location,
+        PostModel, media_root
+):
+    user_client.post("/posts/create/", data={
+        "title": "С фото",
+        "text": "Текст",
+        "pub_date": "2020-01-01T10:00",
+        "category": published_category.id,
+        "location": published_location.id,
+        "is_published": True,
+        "image": make_upload(),
+    })
+    post = PostModel.objects.get(title="С фото")
+    assert post.image_variants == {}, (
+        "Убедитесь, что уменьшенные копии фото создаются фоновой задачей,"
+        " а не во время запроса."
+    )
+    call_command("runworker", "--burst")
+    post.refresh_from_db()
+    widths = [size["width"] for size in post.image_variants["sizes"]]
+    assert widths == [320, 640, 1280], (
+        "Убедитесь, что при загрузке фото создаются уменьшенные копии."
+    )
+    for size in post.image_variants["sizes"]:
+        assert (media_root / size["webp"]).exists()
+        with Image.open(media_root / size["fallback"]) as thumb:
+            assert thumb.width == size["width"]
+
+    content = user_client.get("/").content.decode("utf-8")
+    assert 'type="image/webp"' in content
+    assert "1280w" in content and "1600w" in content
+
+
+def test_make_thumbnails_backfills(
+        mixer, user, published_category, PostModel
+):
+    post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        image=make_upload((700, 400)),
+    )
+    assert post.image_variants == {}
+    updated_at = post.updated_at
+    call_command("make_thumbnails")
+    post.refresh_from_db()
+    assert [size["width"] for size in post.image_variants["sizes"]] == [
+        320, 640
+    ]
+    assert post.updated_at > updated_at, (
+        "Убедитесь, что появление уменьшенных копий меняет дату изменения"
+        " публикации, от которой зависят ETag и Last-Modified."
+    )
+    assert post.image_webp_srcset.endswith("700w")
@@ -0,0 +1,45 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_feed_shows_post_once_its_time_comes(
+        user_client, mixer: Mixer, another_user, published_category
+):
+    now = timezone.now()
+    post = mixer.blend(
+        "blog.Post", author=another_user, category=published_category,
+        is_published=True, pub_date=now + timedelta(hours=1)
+    )
+    assert post not in user_client.get("/").context["page_obj"]
+
+    with mock.patch(
+        "django.utils.timezone.now", return_value=now + timedelta(hours=2)
+    ):
+        page_obj = user_client.get("/").context["page_obj"]
+    assert post in page_obj, (
+        "Убедитесь, что фильтр опубликованных постов вычисляет текущее время"
+        " при каждом запросе, а не при импорте модуля."
+    )
+
+
+def test_published_queryset(
+        mixer: Mixer, user, published_category, PostModel
+):
+    now = timezone.now()
+    visible = mixer.blend("blog.Post", author=user, is_published=True,
+                          category=published_category,
+                          pub_date=now - timedelta(days=1))
+    mixer.blend("blog.Post", author=user, is_published=False,
+                category=published_category, pub_date=now - timedelta(days=1))
+    mixer.blend("blog.Post", author=user, is_published=True,
+                category=published_category, pub_date=now + timedelta(days=1))
+    mixer.blend("blog.Post", author=user, is_published=True,
+                category__is_published=False,
+                pub_date=now - timedelta(days=1))
+    assert list(PostModel.objects.published()) == [visible]
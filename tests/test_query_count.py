@@ -0,0 +1,51 @@
+import pytest
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+# Сессия и пользователь читаются из кэша и запросов к базе не добавляют;
+# запросы каждой страницы перечислены в комментариях.
+AUTH_QUERIES = 0
+
+
+@pytest.fixture
+def own_comment(mixer: Mixer, user, post_with_published_location):
+    return mixer.blend(
+        "blog.Comment", author=user, post=post_with_published_location
+    )
+
+
+@pytest.mark.parametrize(
+    "url_pattern, expected_queries",
+    [
+        # публикация, комментарии
+        ("/posts/{post_id}/", 2),
+        # профиль, даты для ETag, COUNT(*), страница ленты
+        ("/profile/{username}/", 5),
+        # категория, даты для ETag, COUNT(*), страница ленты
+        ("/category/{slug}/", 5),
+        # даты для ETag, COUNT(*), страница ленты
+        ("/", 4),
+        # публикация, варианты местоположений и категорий в форме
+        ("/posts/{post_id}/edit/", 3),
+        # публикация
+        ("/posts/{post_id}/delete/", 1),
+        # комментарий
+        ("/posts/{post_id}/edit_comment/{comment_id}/", 1),
+        ("/posts/{post_id}/delete_comment/{comment_id}/", 1),
+    ],
+)
+def test_view_query_count(
+        user_client, django_assert_num_queries, user, published_category,
+        post_with_published_location, own_comment, url_pattern,
+        expected_queries
+):
+    url = url_pattern.format(
+        post_id=post_with_published_location.id,
+        comment_id=own_comment.id,
+        username=user.username,
+        slug=published_category.slug,
+    )
+    with django_assert_num_queries(AUTH_QUERIES + expected_queries):
+        response = user_client.get(url)
+    assert response.status_code == 200
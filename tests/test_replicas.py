@@ -0,0 +1,63 @@
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from blogicum.replicas import (
+    PRIMARY_COOKIE, ReplicaMiddleware, ReplicaRouter
+)
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DATABASE_REPLICAS = {"replica": "replica.sqlite3"}
+
+
+def route(request):
+    from blog.models import Post
+
+    seen = {}
+
+    def get_response(request):
+        seen["read"] = ReplicaRouter().db_for_read(Post)
+        seen["write"] = ReplicaRouter().db_for_write(Post)
+        return HttpResponse()
+
+    response = ReplicaMiddleware(get_response)(request)
+    return seen, response
+
+
+def test_safe_requests_read_from_replica(replicas):
+    seen, response = route(RequestFactory().get("/"))
+    assert seen == {"read": "replica", "write": "default"}, (
+        "Убедитесь, что GET-запросы читают из реплики, а пишут в основную"
+        " базу."
+    )
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+def test_writes_pin_reads_to_primary(replicas):
+    seen, response = route(RequestFactory().post("/posts/1/comment/"))
+    assert seen["read"] == "default"
+    assert PRIMARY_COOKIE in response.cookies
+
+    request = RequestFactory().get("/posts/1/")
+    request.COOKIES[PRIMARY_COOKIE] = "1"
+    seen, _ = route(request)
+    assert seen["read"] == "default", (
+        "Убедитесь, что после отправки формы автор читает свои изменения"
+        " из основной базы."
+    )
+
+
+def test_router_outside_requests_uses_primary(replicas):
+    from blog.models import Post
+
+    assert ReplicaRouter().db_for_read(Post) == "default"
+    assert ReplicaRouter().allow_migrate("replica", "blog") is False
+
+
+def test_middleware_disabled_without_replicas(settings):
+    settings.DATABASE_REPLICAS = {}
+    with pytest.raises(MiddlewareNotUsed):
+        ReplicaMiddleware(lambda request: HttpResponse())
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def make_post(mixer: Mixer, user, published_category):
+    def make(**kwargs):
+        kwargs.setdefault("pub_date", timezone.now() - timedelta(days=1))
+        kwargs.setdefault("is_published", True)
+        return mixer.blend(
+            "blog.Post", author=user, category=published_category, **kwargs
+        )
+    return make
+
+
+def search(client, query):
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == 200
+    return list(response.context["page_obj"])
+
+
+def test_search_ranks_title_matches_first(client, make_post):
+    in_text = make_post(title="Заметка", text="Прогулка по парку осенью")
+    in_title = make_post(title="Осенью в парке", text="Немного текста")
+    make_post(title="Другое", text="Ничего общего")
+
+    assert search(client, "осенью") == [in_title, in_text], (
+        "Убедитесь, что поиск находит публикации по заголовку и тексту и"
+        " ставит совпадения в заголовке выше."
+    )
+    assert search(client, "парк") == [in_title, in_text], (
+        "Убедитесь, что последнее слово запроса ищется как префикс."
+    )
+
+
+def test_search_uses_published_rules(
+        client, make_post, mixer: Mixer, user
+):
+    make_post(title="Черновик поиска", is_published=False)
+    make_post(title="Отложенный поиск",
+              pub_date=timezone.now() + timedelta(days=1))
+    hidden = mixer.blend("blog.Category", is_published=False)
+    mixer.blend("blog.Post", author=user, category=hidden,
+                title="Скрытый поиск", is_published=True,
+                pub_date=timezone.now() - timedelta(days=1))
+
+    assert search(client, "поиск") == [], (
+        "Убедитесь, что поиск не показывает снятые с публикации, отложенные"
+        " и скрытые по категории публикации."
+    )
+
+
+def test_search_index_follows_post_changes(client, make_post):
+    post = make_post(title="Старое название")
+    post.title = "Новое название"
+    post.save()
+    assert search(client, "старое") == []
+    assert search(client, "новое") == [post], (
+        "Убедитесь, что индекс поиска обновляется при изменении публикации."
+    )
+    post.delete()
+    assert search(client, "новое") == [], (
+        "Убедитесь, что удалённые публикации пропадают из поиска."
+    )
+
+
+@pytest.mark.parametrize("query", ["", '"', "AND OR NOT", 'a" OR "b', "*"])
+def test_search_escapes_query_syntax(client, make_post, query):
+    make_post(title="AND OR NOT")
+    search(client, query)
+
+
+def test_search_does_not_introspect_schema(client, make_post):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    make_post(title="Осенний парк")
+    search(client, "парк")
+    with CaptureQueriesContext(connection) as queries:
+        assert search(client, "парк")
+    assert not any("sqlite_master" in query["sql"] for query in queries), (
+        "Убедитесь, что наличие таблицы поиска не проверяется на каждый"
+        " поисковый запрос."
+    )
@@ -0,0 +1,50 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+SEED_OPTIONS = dict(
+    users=5, categories=3, locations=2, posts=40, comments_per_post=2,
+    batch_size=7, seed=1,
+)
+
+
+def seed():
+    from blog.models import Post
+
+    call_command('seed', stdout=StringIO(), **SEED_OPTIONS)
+    return list(Post.objects.order_by('pk').values_list(
+        'title', 'is_published', 'author__username', 'category__slug',
+        'comment_count',
+    ))
+
+
+def test_seed_is_deterministic(django_user_model):
+    from blog.models import Category, Location, Post
+
+    first = seed()
+    assert len(first) == SEED_OPTIONS['posts']
+    Post.objects.all().delete()
+    Category.objects.all().delete()
+    Location.objects.all().delete()
+    django_user_model.objects.all().delete()
+    assert seed() == first, (
+        'Убедитесь, что команда seed с одним и тем же --seed создаёт'
+        ' одинаковые данные.'
+    )
+
+
+def test_seed_keeps_comment_count_in_sync():
+    from django.db.models import Count, F
+
+    from blog.models import Post
+
+    seed()
+    mismatched = Post.objects.annotate(
+        actual=Count('comments')
+    ).exclude(comment_count=F('actual'))
+    assert not mismatched.exists(), (
+        'Убедитесь, что команда seed заполняет счётчик комментариев.'
+    )
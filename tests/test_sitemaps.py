@@ -0,0 +1,85 @@
+from datetime import timedelta
+from http import HTTPStatus
+from xml.etree import ElementTree
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+BASE_URL = "http://testserver"
+
+
+def read_locations(path):
+    root = ElementTree.parse(path).getroot()
+    return [
+        (item.findtext("sm:loc", namespaces=NS),
+         item.findtext("sm:lastmod", namespaces=NS))
+        for item in root
+    ]
+
+
+def test_sitemaps_list_published_pages_in_chunks(
+        tmp_path, mixer: Mixer, published_category
+):
+    now = timezone.now()
+    authors = mixer.cycle(5).blend("auth.User")
+    for author in authors:
+        mixer.blend(
+            "blog.Post", author=author, category=published_category,
+            is_published=True, pub_date=now - timedelta(days=1),
+        )
+    waiting = mixer.blend("auth.User")
+    mixer.blend(
+        "blog.Post", author=waiting, category=published_category,
+        is_published=True, pub_date=now + timedelta(days=1),
+    )
+
+    call_command("write_sitemaps", output=tmp_path, base_url=BASE_URL,
+                 chunk_size=2)
+
+    index = read_locations(tmp_path / "sitemap.xml")
+    profile_sitemaps = [loc for loc, _ in index if "sitemap-profiles-" in loc]
+    assert len(profile_sitemaps) == 3, (
+        "Убедитесь, что адреса разбиты на файлы по --chunk-size адресов."
+    )
+    assert all(lastmod for _, lastmod in index), (
+        "Убедитесь, что в оглавлении карты сайта указан lastmod."
+    )
+    urls = {}
+    for loc, _ in index:
+        urls.update(read_locations(tmp_path / loc.rsplit("/", 1)[1]))
+    for author in authors:
+        assert f"{BASE_URL}/profile/{author.username}/" in urls
+    assert f"{BASE_URL}/profile/{waiting.username}/" not in urls, (
+        "Убедитесь, что в карту сайта попадают только профили с"
+        " опубликованными постами."
+    )
+    assert not any("/posts/" in loc for loc in urls), (
+        "Убедитесь, что в карту сайта не попадают страницы публикаций:"
+        " они доступны только после входа."
+    )
+    assert f"{BASE_URL}/category/{published_category.slug}/" in urls
+    assert all(urls.values())
+
+
+def test_sitemap_is_served_from_disk(
+        client, tmp_path, mixer: Mixer, user, published_category
+):
+    mixer.blend("blog.Post", author=user, category=published_category,
+                pub_date=timezone.now() - timedelta(days=1))
+    with override_settings(SITEMAP_ROOT=tmp_path):
+        call_command("write_sitemaps", base_url=BASE_URL)
+        response = client.get("/sitemap.xml")
+        assert response.status_code == HTTPStatus.OK
+        assert b"sitemap-profiles-1.xml" in b"".join(response.streaming_content)
+        assert client.get(
+            "/sitemap.xml",
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        ).status_code == HTTPStatus.NOT_MODIFIED
+
+    assert "/sitemap.xml" in client.get("/robots.txt").content.decode()
@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+from django.db.utils import ConnectionHandler
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def production_connection(settings, tmp_path):
+    handler = ConnectionHandler({
+        "default": {
+            "ENGINE": "blogicum.sqlite",
+            "NAME": tmp_path / "db.sqlite3",
+            **settings.DATABASE_PROFILES["production"],
+        }
+    })
+    connection = handler["default"]
+    yield connection
+    connection.close()
+
+
+def test_production_profile_applies_pragmas(production_connection):
+    with production_connection.cursor() as cursor:
+        pragmas = {
+            name: cursor.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ("journal_mode", "synchronous", "busy_timeout")
+        }
+    assert pragmas == {
+        "journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000
+    }, (
+        "Убедитесь, что при подключении к базе в профиле production"
+        " включаются WAL, synchronous=NORMAL и busy_timeout."
+    )
+    assert production_connection.settings_dict["CONN_MAX_AGE"] > 0
+
+
+def test_production_profile_takes_write_lock_on_begin(
+        production_connection, tmp_path
+):
+    production_connection.ensure_connection()
+    production_connection._start_transaction_under_autocommit()
+    other = sqlite3.connect(tmp_path / "db.sqlite3", timeout=0)
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other.execute("BEGIN IMMEDIATE")
+    finally:
+        other.close()
+        production_connection.connection.rollback()
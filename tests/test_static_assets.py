@@ -0,0 +1,79 @@
+import gzip
+import json
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+pytestmark = [pytest.mark.django_db]
+
+CSS = "css/bootstrap.min.css"
+
+
+@pytest.fixture(scope="module")
+def collected(tmp_path_factory):
+    root = tmp_path_factory.mktemp("static")
+    with override_settings(STATIC_ROOT=root, PAGE_CACHE_ENABLED=False):
+        call_command("collectstatic", interactive=False, verbosity=0,
+                     ignore_patterns=["admin"])
+        manifest = json.loads((root / "staticfiles.json").read_text())
+        yield root, manifest["paths"]
+
+
+def test_collectstatic_hashes_and_compresses(collected, client):
+    root, paths = collected
+    hashed = paths[CSS]
+    assert hashed != CSS, (
+        "Убедитесь, что collectstatic добавляет хеш содержимого к именам."
+    )
+    assert gzip.decompress((root / f"{hashed}.gz").read_bytes()) == (
+        (root / hashed).read_bytes()
+    )
+    assert not (root / f"{paths['img/logo.png']}.gz").exists(), (
+        "Убедитесь, что уже сжатые форматы не сжимаются повторно."
+    )
+
+    content = client.get("/pages/about/").content.decode("utf-8")
+    assert f"/static/{hashed}" in content, (
+        "Убедитесь, что шаблоны ссылаются на статику по именам с хешем."
+    )
+    assert f"/static/{paths['img/logo.png']}" in content
+
+
+def test_static_files_are_served_precompressed(collected, client):
+    root, paths = collected
+    url = f"/static/{paths[CSS]}"
+
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Content-Type"].startswith("text/css")
+    assert "Accept-Encoding" in response["Vary"]
+    assert "immutable" in response["Cache-Control"], (
+        "Убедитесь, что файлы с хешем в имени отдаются с"
+        " Cache-Control: immutable."
+    )
+    assert gzip.decompress(b"".join(response.streaming_content)) == (
+        (root / paths[CSS]).read_bytes()
+    )
+
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0")
+    assert not response.has_header("Content-Encoding")
+
+    response = client.get(f"/static/{CSS}", HTTP_ACCEPT_ENCODING="gzip")
+    assert "immutable" not in response["Cache-Control"], (
+        "Убедитесь, что файлы без хеша в имени браузер перепроверяет."
+    )
+    assert client.get("/static/../manage.py").status_code in (
+        HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND
+    )
+
+
+def test_brotli_is_preferred(collected, client):
+    pytest.importorskip("brotli")
+    _, paths = collected
+    response = client.get(
+        f"/static/{paths[CSS]}", HTTP_ACCEPT_ENCODING="gzip, br"
+    )
+    assert response["Content-Encoding"] == "br"
@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db import connections
+from django.utils import timezone
+
+from tasks.models import Task
+from tasks.queue import task
+
+pytestmark = [pytest.mark.django_db]
+
+CALLS = []
+
+
+@task(max_attempts=2)
+def flaky(value):
+    CALLS.append(value)
+    if len(CALLS) == 1:
+        raise RuntimeError("временная ошибка")
+
+
+@task
+def broken():
+    raise RuntimeError("постоянная ошибка")
+
+
+@task(cpu_bound=True)
+def check_fresh_process():
+    if connections["default"].connection is not None:
+        raise RuntimeError("процесс пула унаследовал соединение с базой")
+
+
+def test_task_is_retried_with_backoff():
+    CALLS.clear()
+    queued = flaky.delay(7)
+    call_command("runworker", "--burst")
+    queued.refresh_from_db()
+    assert queued.status == Task.Status.QUEUED
+    assert queued.run_at > timezone.now(), (
+        "Убедитесь, что упавшая задача откладывается перед повтором."
+    )
+    assert "временная ошибка" in queued.last_error
+
+    Task.objects.filter(pk=queued.pk).update(
+        run_at=timezone.now() - timedelta(seconds=1)
+    )
+    call_command("runworker", "--burst")
+    queued.refresh_from_db()
+    assert queued.status == Task.Status.DONE
+    assert CALLS == [7, 7]
+
+
+def test_task_fails_after_max_attempts():
+    queued = broken.delay()
+    Task.objects.filter(pk=queued.pk).update(max_attempts=1)
+    call_command("runworker", "--burst")
+    queued.refresh_from_db()
+    assert queued.status == Task.Status.FAILED
+    assert queued.attempts == 1
+
+
+def test_password_reset_mail_is_queued(client, user):
+    user.email = "reader@example.com"
+    user.save()
+    client.post("/auth/password_reset/", data={"email": user.email})
+    assert mail.outbox == [], (
+        "Убедитесь, что письмо для сброса пароля отправляется фоновой"
+        " задачей, а не во время запроса."
+    )
+    call_command("runworker", "--burst")
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == [user.email]
+
+
+def test_pool_processes_do_not_inherit_connections():
+    queued = check_fresh_process.delay()
+    call_command("runworker", "--burst", "--processes", "1")
+    queued.refresh_from_db()
+    assert queued.status == Task.Status.DONE, (
+        "Убедитесь, что процессы пула открывают собственные соединения с"
+        " базой, а не наследуют соединение команды. "
+        f"{queued.last_error}"
+    )
+
+
+def test_stale_task_is_not_reclaimed_forever():
+    queued = broken.delay()
+    Task.objects.filter(pk=queued.pk).update(
+        status=Task.Status.RUNNING,
+        attempts=queued.max_attempts,
+        started_at=timezone.now() - timedelta(days=1),
+    )
+    call_command("runworker", "--burst")
+    queued.refresh_from_db()
+    assert queued.status == Task.Status.FAILED, (
+        "Убедитесь, что зависшая задача, исчерпавшая попытки, не забирается"
+        " воркером снова, а помечается как упавшая."
+    )
+    assert queued.attempts == queued.max_attempts